@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-import base64
 import json
 import os
 import sys
 
 import requests
 
+try:
+    from pybase64 import b64decode
+except ImportError:  # pragma: no cover - optional SIMD-accelerated decoder
+    from base64 import b64decode
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional faster JSON codec
+    from json import dumps as _json_dumps
+    from json import loads as _json_loads
+
 MCP_ENDPOINT = os.environ.get("MCP_ENDPOINT", "http://127.0.0.1:8000/mcp")
 CPACS_PATH = os.environ["CPACS_PATH"]
 OUTPUT_PATH = os.environ.get("OUT", "aircraft.step")
@@ -18,9 +29,12 @@ COMPONENT_UID = os.environ.get("COMPONENT_UID")  # If set, export only this comp
 if not OUTPUT_PATH.lower().endswith((".step", ".stp")):
     OUTPUT_PATH = f"{OUTPUT_PATH}.step"
 
+# One pooled keep-alive session serves the GET and every JSON-RPC POST.
+_HTTP = requests.Session()
+
 
 def _create_headers() -> dict[str, str]:
-    response = requests.get(
+    response = _HTTP.get(
         MCP_ENDPOINT,
         headers={"Accept": "application/json, text/event-stream"},
         timeout=2,
@@ -41,18 +55,27 @@ def _create_headers() -> dict[str, str]:
 def _post_json(
     payload: dict[str, object], headers: dict[str, str]
 ) -> dict[str, object]:
-    response = requests.post(
+    response = _HTTP.post(
         MCP_ENDPOINT,
         headers=headers,
-        data=json.dumps(payload),
+        data=_json_dumps(payload),
         timeout=300,
+        stream=True,
     )
-    lines = [line for line in response.text.splitlines() if line.startswith("data: ")]
-    if not lines:
+    last_data: bytes | None = None
+    # Non-data lines are kept so a response without any can be reported whole.
+    other_lines: list[bytes] = []
+    for line in response.iter_lines(chunk_size=65536):
+        if line.startswith(b"data: "):
+            last_data = line
+        else:
+            other_lines.append(line)
+    if last_data is None:
         print("No SSE data lines", file=sys.stderr)
-        print(response.text, file=sys.stderr)
+        print(f"HTTP {response.status_code}", file=sys.stderr)
+        print(b"\n".join(other_lines).decode("utf-8", "replace"), file=sys.stderr)
         raise SystemExit(1)
-    return json.loads(lines[-1][6:])
+    return _json_loads(last_data[6:])
 
 
 def _call_tool(
@@ -86,13 +109,26 @@ def _call_tool(
     if isinstance(content, list) and content:
         text = content[0].get("text")
         if isinstance(text, str):
-            parsed = json.loads(text)
+            parsed = _json_loads(text)
             if isinstance(parsed, dict):
                 return parsed
 
     raise SystemExit(f"Could not parse tool response for {tool_name}")
 
 
+def _write_output(path: str, payload: bytes) -> None:
+    """Write the decoded payload straight to a file descriptor, unbuffered."""
+    # O_BINARY (Windows only) stops the CRT from turning "\n" into "\r\n".
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def main() -> None:
     """Open CPACS and export STEP through a running MCP HTTP endpoint."""
     headers = _create_headers()
@@ -116,7 +152,9 @@ def main() -> None:
         headers,
     )
 
-    cpacs_xml = open(CPACS_PATH, encoding="utf-8").read()
+    # Read raw bytes and decode once, skipping text-mode newline translation.
+    with open(CPACS_PATH, "rb") as file_obj:
+        cpacs_xml = file_obj.read().decode("utf-8")
     open_result = _call_tool(
         headers,
         "open_cpacs",
@@ -141,13 +179,14 @@ def main() -> None:
     if not isinstance(cad_base64, str):
         raise SystemExit("export_configuration_cad did not return cad_base64")
 
-    cad_bytes = base64.b64decode(cad_base64)
-    with open(OUTPUT_PATH, "wb") as file_obj:
-        file_obj.write(cad_bytes)
-
-    header = cad_bytes[:16].decode("utf-8", "ignore").lstrip()
+    # Sniff the payload from its first base64 quanta before paying for the
+    # full decode.
+    header = b64decode(cad_base64[:24])[:16].decode("utf-8", "ignore").lstrip()
     if header.startswith("solid"):
-        raise SystemExit(f"Output looks like STL, not STEP: {OUTPUT_PATH}")
+        raise SystemExit(f"Payload looks like STL, not STEP: {OUTPUT_PATH}")
+
+    cad_bytes = b64decode(cad_base64)
+    _write_output(OUTPUT_PATH, cad_bytes)
 
     print(f"wrote {OUTPUT_PATH} bytes={len(cad_bytes)}")
 
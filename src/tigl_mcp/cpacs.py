@@ -8,14 +8,21 @@ on producing deterministic, well-structured JSON for the MCP tools.
 
 from __future__ import annotations
 
+import re
+import sys
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from xml.etree import ElementTree as ET
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
-    """Axis-aligned bounding box."""
+    """Axis-aligned bounding box.
+
+    Boxes are immutable and slotted so each one stores six floats without a
+    per-instance ``__dict__``.
+    """
 
     xmin: float
     xmax: float
@@ -25,8 +32,12 @@ class BoundingBox:
     zmax: float
 
     @classmethod
+    @lru_cache(maxsize=256)
     def from_index(cls, index: int) -> BoundingBox:
-        """Create a simple bounding box derived from an index."""
+        """Create a simple bounding box derived from an index.
+
+        Boxes are immutable, so components sharing an index share one instance.
+        """
         base = float(index)
         return cls(
             xmin=base,
@@ -40,21 +51,31 @@ class BoundingBox:
     @classmethod
     def combine(cls, boxes: Iterable[BoundingBox]) -> BoundingBox:
         """Combine multiple bounding boxes into a single envelope."""
-        boxes = list(boxes)
-        if not boxes:
+        iterator = iter(boxes)
+        first = next(iterator, None)
+        if first is None:
             return cls(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
-        return cls(
-            xmin=min(box.xmin for box in boxes),
-            xmax=max(box.xmax for box in boxes),
-            ymin=min(box.ymin for box in boxes),
-            ymax=max(box.ymax for box in boxes),
-            zmin=min(box.zmin for box in boxes),
-            zmax=max(box.zmax for box in boxes),
-        )
-
-
-@dataclass
+        xmin, xmax = first.xmin, first.xmax
+        ymin, ymax = first.ymin, first.ymax
+        zmin, zmax = first.zmin, first.zmax
+        for box in iterator:
+            if box.xmin < xmin:
+                xmin = box.xmin
+            if box.xmax > xmax:
+                xmax = box.xmax
+            if box.ymin < ymin:
+                ymin = box.ymin
+            if box.ymax > ymax:
+                ymax = box.ymax
+            if box.zmin < zmin:
+                zmin = box.zmin
+            if box.zmax > zmax:
+                zmax = box.zmax
+        return cls(xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax, zmin=zmin, zmax=zmax)
+
+
+@dataclass(slots=True)
 class ComponentDefinition:
     """Description of a CPACS component."""
 
@@ -65,6 +86,13 @@ class ComponentDefinition:
     symmetry: str | None
     parameters: dict[str, float]
     bounding_box: BoundingBox
+    type_name_lower: str = field(init=False, repr=False, compare=False)
+    uid_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute derived forms used on hot lookup and export paths."""
+        self.type_name_lower = sys.intern(self.type_name.lower())
+        self.uid_bytes = self.uid.encode("utf-8")
 
 
 @dataclass
@@ -75,10 +103,26 @@ class CPACSConfiguration:
     fuselages: list[ComponentDefinition]
     rotors: list[ComponentDefinition]
     engines: list[ComponentDefinition]
+    _components: tuple[ComponentDefinition, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _by_uid: dict[str, ComponentDefinition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_uid_lower: dict[str, ComponentDefinition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Snapshot and index the components once the lists are populated."""
+        self._components = (*self.wings, *self.fuselages, *self.rotors, *self.engines)
+        for component in self._components:
+            self._by_uid.setdefault(component.uid, component)
+            self._by_uid_lower.setdefault(component.uid.lower(), component)
 
-    def all_components(self) -> list[ComponentDefinition]:
-        """Return all components in a single list."""
-        return [*self.wings, *self.fuselages, *self.rotors, *self.engines]
+    def all_components(self) -> tuple[ComponentDefinition, ...]:
+        """Return all components in a single tuple."""
+        return self._components
 
     def bounding_box(self) -> BoundingBox:
         """Envelope covering all components."""
@@ -88,14 +132,10 @@ class CPACSConfiguration:
 
     def find_component(self, uid: str) -> ComponentDefinition | None:
         """Locate a component by UID (exact match first, then case-insensitive)."""
-        for component in self.all_components():
-            if component.uid == uid:
-                return component
-        uid_lower = uid.lower()
-        for component in self.all_components():
-            if component.uid.lower() == uid_lower:
-                return component
-        return None
+        component = self._by_uid.get(uid)
+        if component is None:
+            component = self._by_uid_lower.get(uid.lower())
+        return component
 
 
 @dataclass
@@ -139,51 +179,62 @@ class TiglConfiguration:
         return len(self.cpacs_configuration.engines)
 
 
-def _parse_components(root: ET.Element, tag: str) -> list[ComponentDefinition]:
-    """Parse CPACS components of a given tag."""
-    components: list[ComponentDefinition] = []
-    for index, element in enumerate(root.findall(f".//{tag}"), start=1):
-        # CPACS commonly uses "uID" while fixtures may use lowercase "uid".
-        uid = element.get("uID") or element.get("uid") or f"{tag}_{index}"
-        name = element.get("name") or uid
-        symmetry = element.get("symmetry")
-        parameters: dict[str, float] = {}
-        for attr, raw in element.attrib.items():
-            if attr in {"uid", "uID", "name", "symmetry"}:
-                continue
-            try:
-                parameters[attr] = float(raw)
-            except ValueError:
-                continue
-        components.append(
-            ComponentDefinition(
-                uid=uid,
-                name=name,
-                index=index,
-                type_name=tag.capitalize(),
-                symmetry=symmetry,
-                parameters=parameters,
-                bounding_box=BoundingBox.from_index(index),
-            )
-        )
-    return components
+_COMPONENT_TAGS = ("wing", "fuselage", "rotor", "engine")
+_NON_PARAMETER_ATTRS = frozenset(("uid", "uID", "name", "symmetry"))
+# Plain decimal literals only: screening with a regex avoids raising ValueError
+# for every non-numeric attribute and keeps NaN/inf out of JSON payloads.
+_NUMERIC_ATTR = re.compile(r"\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+
+def _component_from_element(
+    element: ET.Element, tag: str, index: int
+) -> ComponentDefinition:
+    """Build a component definition from a CPACS component element."""
+    # CPACS commonly uses "uID" while fixtures may use lowercase "uid".
+    # Identifiers are interned because they key every lookup index.
+    uid = sys.intern(element.get("uID") or element.get("uid") or f"{tag}_{index}")
+    name = sys.intern(element.get("name") or uid)
+    symmetry = element.get("symmetry")
+    parameters: dict[str, float] = {}
+    for attr, raw in element.attrib.items():
+        if attr not in _NON_PARAMETER_ATTRS and _NUMERIC_ATTR.fullmatch(raw):
+            parameters[attr] = float(raw)
+    return ComponentDefinition(
+        uid=uid,
+        name=name,
+        index=index,
+        type_name=sys.intern(tag.capitalize()),
+        symmetry=symmetry,
+        parameters=parameters,
+        bounding_box=BoundingBox.from_index(index),
+    )
 
 
-def parse_cpacs(xml_content: str) -> CPACSConfiguration:
-    """Parse CPACS XML content into a configuration representation."""
-    root = ET.fromstring(xml_content)
-    wings = _parse_components(root, "wing")
-    fuselages = _parse_components(root, "fuselage")
-    rotors = _parse_components(root, "rotor")
-    engines = _parse_components(root, "engine")
+def _parse_root(root: ET.Element) -> CPACSConfiguration:
+    """Build a configuration from an already parsed CPACS root element.
+
+    Components of every supported type are collected in a single document-order
+    walk rather than one ``findall`` sweep per tag.
+    """
+    buckets: dict[str, list[ComponentDefinition]] = {tag: [] for tag in _COMPONENT_TAGS}
+    for element in root.iter():
+        bucket = buckets.get(element.tag)
+        if bucket is not None and element is not root:
+            bucket.append(
+                _component_from_element(element, element.tag, len(bucket) + 1)
+            )
     return CPACSConfiguration(
-        wings=wings, fuselages=fuselages, rotors=rotors, engines=engines
+        wings=buckets["wing"],
+        fuselages=buckets["fuselage"],
+        rotors=buckets["rotor"],
+        engines=buckets["engine"],
     )
 
 
-def extract_metadata(xml_content: str, file_name: str | None) -> dict[str, str | None]:
-    """Extract common header metadata from CPACS content."""
-    root = ET.fromstring(xml_content)
+def _extract_metadata_root(
+    root: ET.Element, file_name: str | None
+) -> dict[str, str | None]:
+    """Extract header metadata from an already parsed CPACS root element."""
     creator_node = root.find(".//header/creator")
     description_node = root.find(".//header/description")
     return {
@@ -193,12 +244,23 @@ def extract_metadata(xml_content: str, file_name: str | None) -> dict[str, str |
     }
 
 
+def parse_cpacs(xml_content: str) -> CPACSConfiguration:
+    """Parse CPACS XML content into a configuration representation."""
+    return _parse_root(ET.fromstring(xml_content))
+
+
+def extract_metadata(xml_content: str, file_name: str | None) -> dict[str, str | None]:
+    """Extract common header metadata from CPACS content."""
+    return _extract_metadata_root(ET.fromstring(xml_content), file_name)
+
+
 def build_handles(
     xml_content: str, file_name: str | None
 ) -> tuple[TixiDocument, TiglConfiguration, CPACSConfiguration, dict[str, str | None]]:
     """Create TiXI/TiGL stand-ins from XML content."""
+    root = ET.fromstring(xml_content)
     tixi_document = TixiDocument(xml_content=xml_content, file_name=file_name)
-    configuration = parse_cpacs(xml_content)
+    configuration = _parse_root(root)
     tigl_configuration = TiglConfiguration(cpacs_configuration=configuration)
-    metadata = extract_metadata(xml_content, file_name)
+    metadata = _extract_metadata_root(root, file_name)
     return tixi_document, tigl_configuration, configuration, metadata
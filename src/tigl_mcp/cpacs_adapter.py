@@ -78,7 +78,8 @@ def _try_export_step_via_docker(
     try:
         proc = subprocess.run(
             ["docker", "info"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
         if proc.returncode != 0:
@@ -130,8 +131,10 @@ def _try_export_step_via_docker(
                     "-c",
                     script,
                 ],
-                capture_output=True,
-                text=True,
+                # Only stderr is read, and only on failure; the container's
+                # stdout and the stderr of a successful run are never decoded.
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=120,
             )
             step_path = Path(tmpdir) / "output.step"
@@ -144,7 +147,10 @@ def _try_export_step_via_docker(
                     return step_bytes
                 LOGGER.warning("Docker produced non-STEP output")
             else:
-                LOGGER.warning("Docker STEP export failed: %s", result.stderr[:500])
+                LOGGER.warning(
+                    "Docker STEP export failed: %s",
+                    result.stderr[:500].decode("utf-8", errors="replace"),
+                )
         except subprocess.TimeoutExpired:
             LOGGER.warning("Docker STEP export timed out")
         except Exception as exc:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from typing import Any
+from weakref import WeakKeyDictionary, ref
 
 from fastmcp import FastMCP
 from fastmcp.tools import Tool
@@ -22,7 +23,7 @@ class ToolDefinitionAdapter(Tool):
         super().__init__(
             name=definition.name,
             description=definition.description,
-            parameters=definition.parameters_model.model_json_schema(),
+            parameters=definition.parameters_schema(),
             output_schema=definition.output_schema,
             tags=set(),
         )
@@ -40,15 +41,32 @@ def to_fastmcp_tools(tool_definitions: Sequence[ToolDefinition]) -> list[Tool]:
     return [ToolDefinitionAdapter(definition) for definition in tool_definitions]
 
 
+# Built apps are remembered weakly: each app's tools close over their session
+# manager, so holding apps strongly here would keep every manager alive.
+_APPS_BY_MANAGER: WeakKeyDictionary[SessionManager, ref[FastMCP]] = WeakKeyDictionary()
+_TOOLS_BY_APP: WeakKeyDictionary[FastMCP, list[ToolDefinition]] = WeakKeyDictionary()
+
+
 def build_fastmcp_app(
     session_manager: SessionManager,
 ) -> tuple[FastMCP, list[ToolDefinition]]:
-    """Create a FastMCP server instance with all TiGL tools registered."""
+    """Create a FastMCP server instance with all TiGL tools registered.
+
+    While an app built for ``session_manager`` is still alive, later calls
+    (for example on a transport reload) return it instead of rebuilding.
+    """
+    app_ref = _APPS_BY_MANAGER.get(session_manager)
+    cached_app = app_ref() if app_ref is not None else None
+    if cached_app is not None:
+        return cached_app, list(_TOOLS_BY_APP[cached_app])
+
     app = FastMCP(
         name="tigl-mcp",
         instructions=("CPACS/TiGL utilities exposed over the Model Context Protocol."),
     )
     tool_definitions = build_tools(session_manager)
-    for tool in to_fastmcp_tools(tool_definitions):
-        app.add_tool(tool)
-    return app, tool_definitions
+    for definition in tool_definitions:
+        app.add_tool(ToolDefinitionAdapter(definition))
+    _APPS_BY_MANAGER[session_manager] = ref(app)
+    _TOOLS_BY_APP[app] = tool_definitions
+    return app, list(tool_definitions)
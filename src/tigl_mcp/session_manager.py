@@ -2,15 +2,65 @@
 
 from __future__ import annotations
 
+import secrets
 import threading
-import uuid
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 from tigl_mcp.cpacs import CPACSConfiguration, TiglConfiguration, TixiDocument
 from tigl_mcp.errors import MCPError, raise_mcp_error
 
+# Default upper bounds on the artifact and cached export bytes one session
+# keeps; least recently used payloads are evicted first once one is exceeded.
+MAX_ARTIFACT_BYTES = 256 * 1024 * 1024
+MAX_EXPORT_BYTES = 256 * 1024 * 1024
 
-@dataclass
+
+class PayloadCache[K]:
+    """Thread-safe LRU mapping of keys to payloads, bounded by total bytes.
+
+    The newest payload is always kept, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache holding at most ``max_bytes`` of payloads."""
+        self._payloads: OrderedDict[K, bytes] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached payloads."""
+        return len(self._payloads)
+
+    def get(self, key: K) -> bytes | None:
+        """Return the payload for ``key``, marking it recently used."""
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self._payloads.move_to_end(key)
+        return payload
+
+    def put(self, key: K, payload: bytes) -> None:
+        """Store ``payload``, evicting least recently used entries over budget."""
+        with self._lock:
+            previous = self._payloads.pop(key, None)
+            if previous is not None:
+                self._total -= len(previous)
+            self._payloads[key] = payload
+            self._total += len(payload)
+            while self._total > self._max_bytes and len(self._payloads) > 1:
+                _, evicted = self._payloads.popitem(last=False)
+                self._total -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        with self._lock:
+            self._payloads.clear()
+            self._total = 0
+
+
+@dataclass(frozen=True, slots=True)
 class SessionData:
     """Session payload stored by :class:`SessionManager`."""
 
@@ -18,14 +68,34 @@ class SessionData:
     tigl_handle: TiglConfiguration
     config: CPACSConfiguration
     cpacs_xml: str
+    # Export payloads parked for later retrieval; dropped with the session.
+    artifacts: PayloadCache[str]
+    # Real TiGL export output keyed by (component uid, format).
+    exports: PayloadCache[tuple[str, str]]
+    # Serializes filling ``exports`` and therefore every TiGL export call on
+    # ``tigl_handle``; reentrant because SU2 fills the STL entry it needs.
+    export_lock: threading.RLock = field(default_factory=threading.RLock)
 
 
 class SessionManager:
-    """In-memory manager mapping session identifiers to handles."""
+    """In-memory manager mapping session identifiers to handles.
+
+    Writers (``create_session``/``close``) serialize on a lock. Readers rely on
+    single ``dict.get`` calls being atomic and on :class:`SessionData` being
+    immutable, so lookups never take the lock. Each session's artifact and
+    export caches lock internally and are bounded by the byte budgets given
+    here.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_artifact_bytes: int = MAX_ARTIFACT_BYTES,
+        max_export_bytes: int = MAX_EXPORT_BYTES,
+    ) -> None:
         """Initialize the session manager with empty state."""
         self._sessions: dict[str, SessionData] = {}
+        self._max_artifact_bytes = max_artifact_bytes
+        self._max_export_bytes = max_export_bytes
         self._lock = threading.Lock()
 
     def create_session(
@@ -36,13 +106,15 @@ class SessionManager:
         cpacs_xml: str,
     ) -> str:
         """Register a new session and return its identifier."""
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
         with self._lock:
             self._sessions[session_id] = SessionData(
                 tixi_handle=tixi_handle,
                 tigl_handle=tigl_handle,
                 config=config,
                 cpacs_xml=cpacs_xml,
+                artifacts=PayloadCache(self._max_artifact_bytes),
+                exports=PayloadCache(self._max_export_bytes),
             )
         return session_id
 
@@ -50,29 +122,81 @@ class SessionManager:
         self, session_id: str
     ) -> tuple[TixiDocument, TiglConfiguration, CPACSConfiguration]:
         """Retrieve handles for a session or raise an MCP error."""
-        with self._lock:
-            if session_id not in self._sessions:
-                raise MCPError("InvalidSession", f"Unknown session_id '{session_id}'")
-            data = self._sessions[session_id]
+        data = self._sessions.get(session_id)
+        if data is None:
+            raise MCPError("InvalidSession", f"Unknown session_id '{session_id}'")
         return data.tixi_handle, data.tigl_handle, data.config
 
     def get_cpacs_xml(self, session_id: str) -> str:
         """Retrieve the original CPACS XML for a session."""
-        with self._lock:
-            if session_id not in self._sessions:
-                raise MCPError("InvalidSession", f"Unknown session_id '{session_id}'")
-            data = self._sessions[session_id]
+        data = self._sessions.get(session_id)
+        if data is None:
+            raise MCPError("InvalidSession", f"Unknown session_id '{session_id}'")
         return data.cpacs_xml
 
+    def _data(self, session_id: str) -> SessionData:
+        data = self._sessions.get(session_id)
+        if data is None:
+            raise MCPError("InvalidSession", f"Unknown session_id '{session_id}'")
+        return data
+
+    def store_artifact(self, session_id: str, payload: bytes) -> str:
+        """Keep ``payload`` with a session and return its artifact identifier.
+
+        Artifacts live until the session is closed or until newer artifacts
+        push the session past ``max_artifact_bytes``, in which case the
+        least recently read ones are dropped. The newest artifact is always
+        kept, even if it alone exceeds the budget.
+        """
+        artifact_id = secrets.token_hex(8)
+        self._data(session_id).artifacts.put(artifact_id, payload)
+        return artifact_id
+
+    def get_artifact(self, session_id: str, artifact_id: str) -> bytes:
+        """Retrieve a stored artifact or raise an MCP error."""
+        payload = self._data(session_id).artifacts.get(artifact_id)
+        if payload is None:
+            raise MCPError("NotFound", f"Unknown artifact_id '{artifact_id}'")
+        return payload
+
+    def export_cache(self, session_id: str) -> PayloadCache[tuple[str, str]]:
+        """Return the session's cache of exported payloads.
+
+        The CPACS geometry is fixed for the life of a session, so repeat
+        exports can reuse earlier output until :meth:`clear_exports` is called
+        or ``max_export_bytes`` forces the least recently used ones out.
+        """
+        return self._data(session_id).exports
+
+    def export_lock(self, session_id: str) -> threading.RLock:
+        """Return the lock guarding the session's export cache and TiGL handle.
+
+        TiGL is not documented as thread-safe, so concurrent exports for one
+        session take this lock around every cache fill.
+        """
+        return self._data(session_id).export_lock
+
+    def clear_exports(self, session_id: str) -> None:
+        """Drop cached export payloads after the session's model changes."""
+        data = self._data(session_id)
+        with data.export_lock:
+            data.exports.clear()
+
     def close(self, session_id: str) -> None:
-        """Close and remove a session."""
+        """Close and remove a session.
+
+        The session is unregistered before its handles are closed, and the TiXI
+        document is closed even if closing the TiGL configuration fails, so a
+        failing close can neither leak the document nor leave a dead session.
+        """
         with self._lock:
-            data = self._sessions.get(session_id)
-            if data is None:
-                raise_mcp_error("InvalidSession", f"Unknown session_id '{session_id}'")
+            data = self._sessions.pop(session_id, None)
+        if data is None:
+            raise_mcp_error("InvalidSession", f"Unknown session_id '{session_id}'")
+        try:
             data.tigl_handle.close()
+        finally:
             data.tixi_handle.close()
-            del self._sessions[session_id]
 
 
 session_manager = SessionManager()
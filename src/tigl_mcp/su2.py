@@ -0,0 +1,74 @@
+"""Direct STL to SU2 conversion for triangle-only surface meshes."""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import numpy.typing as npt
+
+_BINARY_HEADER = 84
+_BINARY_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("facet", "<f4", (3, 3)), ("attr", "<u2")]
+)
+_ASCII_VERTEX = re.compile(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)")
+
+
+def _binary_facets(stl_bytes: bytes) -> npt.NDArray[np.floating] | None:
+    """Return binary STL vertices as an ``(3N, 3)`` array, else ``None``."""
+    if len(stl_bytes) < _BINARY_HEADER:
+        return None
+    count = int.from_bytes(stl_bytes[80:_BINARY_HEADER], byteorder="little")
+    if _BINARY_HEADER + count * _BINARY_RECORD.itemsize != len(stl_bytes):
+        return None
+    records = np.frombuffer(
+        stl_bytes, dtype=_BINARY_RECORD, count=count, offset=_BINARY_HEADER
+    )
+    return records["facet"].reshape(-1, 3)
+
+
+def _ascii_facets(stl_bytes: bytes) -> npt.NDArray[np.floating] | None:
+    """Return ASCII STL vertices as an ``(3N, 3)`` array, else ``None``."""
+    vertices = _ASCII_VERTEX.findall(stl_bytes)
+    if len(vertices) != 3 * stl_bytes.count(b"endfacet"):
+        return None
+    try:
+        return np.array(vertices, dtype=np.bytes_).astype(np.float64)
+    except ValueError:
+        return None
+
+
+def stl_to_su2_bytes(stl_bytes: bytes) -> bytes | None:
+    """Convert a triangle STL payload to SU2, or return ``None`` if unsure.
+
+    The output matches ``meshio`` (STL read, SU2 write) byte for byte: points
+    are de-duplicated in first-seen order and every triangle is written as a
+    boundary element under marker ``1``. ``None`` means the payload is not a
+    plain triangle STL and the caller should fall back to ``meshio``.
+    """
+    facets = _binary_facets(stl_bytes)
+    if facets is None:
+        facets = _ascii_facets(stl_bytes)
+    if facets is None or len(facets) == 0:
+        return None
+
+    _, first, inverse = np.unique(
+        facets, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    points = facets[first[order]]
+    triangles = np.argsort(order)[inverse.reshape(-1)].reshape(-1, 3)
+
+    # One %-format over the flattened arrays replaces np.savetxt's per-row
+    # Python loop while producing the same "%.18e" / "%d" text.
+    point_rows = b"%.18e %.18e %.18e\n" * len(points) % tuple(points.ravel().tolist())
+    element_rows = b"5 %d %d %d\n" * len(triangles) % tuple(triangles.ravel().tolist())
+    return b"".join(
+        (
+            b"NDIME= 3\nNPOIN= %d\n" % len(points),
+            point_rows,
+            b"NELEM= 0\nNMARK= 1\nMARKER_TAG= 1\n",
+            b"MARKER_ELEMS= %d\n" % len(triangles),
+            element_rows,
+        )
+    )
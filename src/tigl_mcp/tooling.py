@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import cache, wraps
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from tigl_mcp.errors import MCPError, raise_mcp_error
 
 
 class ToolParameters(BaseModel):
@@ -15,6 +18,136 @@ class ToolParameters(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+@cache
+def _parameters_json_schema(model: type[ToolParameters]) -> dict[str, Any]:
+    """Build and memoize the JSON schema for a parameters model class.
+
+    Tool definitions are rebuilt whenever an app is assembled, but their
+    parameter models are module-level classes, so the schema is shared.
+    """
+    return model.model_json_schema()
+
+
+class ValidatedParameters(dict[str, Any]):
+    """Parameter mapping already validated against ``model``.
+
+    Returned by :meth:`ToolDefinition.validate` so that
+    :func:`parse_parameters` can rebuild the model without validating twice.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, model: type[ToolParameters], values: dict[str, Any]) -> None:
+        """Wrap ``values`` that passed validation for ``model``."""
+        super().__init__(values)
+        self.model = model
+
+
+def parse_parameters[P: ToolParameters](model: type[P], raw: dict[str, Any]) -> P:
+    """Validate ``raw`` into ``model`` inside a tool handler.
+
+    Payloads coming from :meth:`ToolDefinition.validate` (the FastMCP path) are
+    trusted and only reassembled; anything else goes through Pydantic.
+    """
+    if type(raw) is ValidatedParameters and raw.model is model:
+        return model.model_construct(**raw)
+    return model.model_validate(raw)
+
+
+@cache
+def _parameters_adapter(model: type[ToolParameters]) -> TypeAdapter[ToolParameters]:
+    """Build and memoize the validation adapter for a parameters model class."""
+    return TypeAdapter(model)
+
+
+@cache
+def _string_fields(
+    model: type[ToolParameters],
+) -> tuple[tuple[str, bool, bool], ...] | None:
+    """Describe a model made only of plain ``str`` fields, else return ``None``.
+
+    Each entry is ``(name, required, nullable)``. Models with aliases,
+    constraints, validators, non-``None`` defaults or any ``model_config``
+    beyond the :class:`ToolParameters` default (``str_strip_whitespace``,
+    ``strict``, ``str_max_length``, ...) are excluded and always go through
+    Pydantic.
+    """
+    if model.model_config != ToolParameters.model_config:
+        return None
+    decorators = model.__pydantic_decorators__
+    if decorators.validators or decorators.field_validators:
+        return None
+    if decorators.root_validators or decorators.model_validators:
+        return None
+    fields: list[tuple[str, bool, bool]] = []
+    for name, info in model.model_fields.items():
+        if info.alias is not None or info.validation_alias is not None:
+            return None
+        if info.metadata or info.default_factory:
+            return None
+        if info.annotation is str:
+            nullable = False
+        elif info.annotation == (str | None):
+            nullable = True
+        else:
+            return None
+        required = info.is_required()
+        if not required and info.default is not None:
+            return None
+        fields.append((name, required, nullable))
+    return tuple(fields)
+
+
+def _validate_string_fields(
+    fields: tuple[tuple[str, bool, bool], ...], parameters: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Validate ``parameters`` against plain string fields without Pydantic.
+
+    Returns ``None`` whenever the payload is not trivially valid, leaving
+    coercion and error reporting to the full validator.
+    """
+    values: dict[str, Any] = {}
+    matched = 0
+    for name, required, nullable in fields:
+        if name in parameters:
+            matched += 1
+            value = parameters[name]
+            if type(value) is not str and not (value is None and nullable):
+                return None
+            values[name] = value
+        elif required:
+            return None
+        else:
+            values[name] = None
+    if matched != len(parameters):
+        # Unknown keys: let Pydantic report the ``extra="forbid"`` violation.
+        return None
+    return values
+
+
+# Default values that are safe to share between calls through a shallow copy.
+_IMMUTABLE_DEFAULT_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _with_error_wrapping(
+    handler: Callable[[dict[str, Any]], dict[str, Any]],
+    error_type: str,
+    error_message: str,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return ``handler`` with non-MCP exceptions mapped to an :class:`MCPError`."""
+
+    @wraps(handler)
+    def wrapped(parameters: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return handler(parameters)
+        except MCPError:
+            raise
+        except Exception as exc:
+            raise_mcp_error(error_type, error_message, str(exc))
+
+    return wrapped
+
+
 @dataclass
 class ToolDefinition:
     """Description of a tool that can be registered with the server.
@@ -24,6 +157,9 @@ class ToolDefinition:
         description: Human-readable description of the tool purpose.
         parameters_model: Pydantic model used to validate input parameters.
         handler: Callable that executes the tool logic.
+        error_type: When set, unexpected handler exceptions are converted into
+            an :class:`MCPError` of this type carrying ``error_message``.
+        error_message: Message used for those converted errors.
 
     """
 
@@ -32,6 +168,18 @@ class ToolDefinition:
     parameters_model: type[ToolParameters]
     handler: Callable[[dict[str, Any]], dict[str, Any]]
     output_schema: dict[str, Any] | None = field(default=None)
+    error_type: str | None = field(default=None)
+    error_message: str = field(default="Tool execution failed")
+    _empty_call_defaults: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Wrap the handler once so it reports unexpected errors uniformly."""
+        if self.error_type is not None:
+            self.handler = _with_error_wrapping(
+                self.handler, self.error_type, self.error_message
+            )
 
     def validate(self, parameters: dict[str, Any]) -> dict[str, Any]:
         """Validate and coerce incoming tool parameters.
@@ -46,18 +194,43 @@ class ToolDefinition:
             Validated parameter dictionary.
 
         """
+        if not parameters and self._empty_call_defaults is not None:
+            # Argument-less calls (e.g. ``ping``) always validate to the same
+            # defaults, so skip Pydantic after the first one.
+            return ValidatedParameters(self.parameters_model, self._empty_call_defaults)
+        fields = _string_fields(self.parameters_model)
+        if fields is not None:
+            # Session-only style models (just ``session_id`` and friends) are
+            # checked by hand; anything unusual falls through to Pydantic.
+            values = _validate_string_fields(fields, parameters)
+            if values is not None:
+                return ValidatedParameters(self.parameters_model, values)
         try:
-            model = self.parameters_model(**parameters)
+            model = _parameters_adapter(self.parameters_model).validate_python(
+                parameters
+            )
         except ValidationError as error:
             raise ValueError(f"Invalid parameters for tool '{self.name}'") from error
-        return model.model_dump()
+        if not parameters and all(
+            type(value) in _IMMUTABLE_DEFAULT_TYPES for value in model.__dict__.values()
+        ):
+            # Only immutable defaults are remembered: the shallow copy handed
+            # out per call would otherwise share lists or dicts between calls.
+            self._empty_call_defaults = dict(model.__dict__)
+        # The model is discarded, so hand out its validated field mapping
+        # instead of re-serializing it through ``model_dump``.
+        return ValidatedParameters(self.parameters_model, model.__dict__)
+
+    def parameters_schema(self) -> dict[str, Any]:
+        """Return the JSON schema of the parameters model, built once per model."""
+        return _parameters_json_schema(self.parameters_model)
 
     def metadata(self) -> dict[str, Any]:
         """Return a discovery-friendly description of the tool."""
         metadata: dict[str, Any] = {
             "name": self.name,
             "description": self.description,
-            "schema": self.parameters_model.model_json_schema(),
+            "schema": self.parameters_schema(),
         }
         if self.output_schema is not None:
             metadata["output_schema"] = self.output_schema
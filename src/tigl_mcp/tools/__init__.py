@@ -12,7 +12,9 @@ from tigl_mcp.tools.configuration import (
 from tigl_mcp.tools.cpacs_io import close_cpacs_tool, open_cpacs_tool
 from tigl_mcp.tools.export import (
     export_component_mesh_tool,
+    export_component_meshes_tool,
     export_configuration_cad_tool,
+    get_export_artifact_tool,
 )
 from tigl_mcp.tools.metrics import (
     get_fuselage_summary_tool,
@@ -45,7 +47,9 @@ def build_tools(session_manager: SessionManager) -> list[ToolDefinition]:
         intersect_with_plane_tool(session_manager),
         intersect_components_tool(session_manager),
         export_component_mesh_tool(session_manager),
+        export_component_meshes_tool(session_manager),
         export_configuration_cad_tool(session_manager),
+        get_export_artifact_tool(session_manager),
         get_high_level_parameters_tool(session_manager),
         set_high_level_parameters_tool(session_manager),
     ]
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import pathlib
+from functools import cache
 from importlib import import_module
 from typing import Any, Literal, cast
 
-from tigl_mcp import cpacs_stubs
-from tigl_mcp.cpacs import build_handles, parse_cpacs
-from tigl_mcp.errors import MCPError, raise_mcp_error
+from tigl_mcp.cpacs import build_handles
+from tigl_mcp.errors import raise_mcp_error
 from tigl_mcp.session_manager import SessionManager
-from tigl_mcp.tooling import ToolDefinition, ToolParameters
+from tigl_mcp.tooling import ToolDefinition, ToolParameters, parse_parameters
 
 
 class OpenCpacsParams(ToolParameters):
@@ -26,17 +28,58 @@ class CloseCpacsParams(ToolParameters):
     session_id: str
 
 
+# Files at least this large are decoded straight from a memory map, so the
+# full-size intermediate ``bytes`` copy never coexists with the decoded text.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_file_text(path: pathlib.Path) -> str:
+    """Read and decode a UTF-8 file with as few full-size copies as possible.
+
+    Small files use unbuffered ``os.read`` calls sized by ``fstat``; large ones
+    are memory-mapped and decoded in place.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, "utf-8")
+        chunks: list[bytes] = []
+        while True:
+            # A single read normally returns the whole file; keep going for
+            # short reads and files that grew after ``fstat``.
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    raw = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    return raw.decode("utf-8")
+
+
 def _read_source(params: OpenCpacsParams) -> tuple[str, str | None]:
     if params.source_type == "path":
         path = pathlib.Path(params.source)
-        if not path.exists():
+        # One read, decoded once: the resulting string is shared by the parser,
+        # the TiXI handle and the session store rather than re-read per consumer.
+        try:
+            content = _read_file_text(path)
+        except FileNotFoundError:
             raise_mcp_error("InvalidInput", f"File not found: {path}")
-        return path.read_text(encoding="utf-8"), str(path)
+        return content, str(path)
     return params.source, None
 
 
+@cache
 def _load_real_bindings() -> tuple[object | None, object | None]:
-    """Load TiXI/TiGL wrappers when optional native dependencies are present."""
+    """Load TiXI/TiGL wrappers when optional native dependencies are present.
+
+    The import is deferred to the first ``open_cpacs`` call so server startup
+    never pays for the native bindings, and the outcome (including their
+    absence, which Python does not cache) is remembered for later calls.
+    """
     try:
         tigl_wrapper = import_module("tigl3.tigl3wrapper")
         tixi_wrapper = import_module("tixi3.tixi3wrapper")
@@ -49,58 +92,57 @@ def open_cpacs_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the open_cpacs tool definition."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = OpenCpacsParams.model_validate(raw_params)
-            xml_content, file_name = _read_source(params)
-            cpacs_config = parse_cpacs(xml_content)
-            tixi3wrapper, tigl3wrapper = _load_real_bindings()
-
-            if (
-                tixi3wrapper is not None and tigl3wrapper is not None
-            ):  # pragma: no cover
-                tixi_module = cast(Any, tixi3wrapper)
-                tigl_module = cast(Any, tigl3wrapper)
-
-                tixi_handle: Any = tixi_module.Tixi3()
-                if hasattr(tixi_handle, "openString"):
-                    tixi_handle.openString(xml_content)
-                elif hasattr(tixi_handle, "openDocumentFromString"):
-                    tixi_handle.openDocumentFromString(xml_content)
-                else:
-                    raise_mcp_error(
-                        "OpenError",
-                        "No supported TIXI open-from-string API found.",
-                    )
-
-                tigl_handle: Any = tigl_module.Tigl3()
-                tigl_handle.open(tixi_handle, "")
+        params = parse_parameters(OpenCpacsParams, raw_params)
+        xml_content, file_name = _read_source(params)
+        # Parse the XML once; the stub handles are cheap wrappers around the
+        # parsed configuration and are simply unused with real bindings.
+        stub_tixi, stub_tigl, cpacs_config, metadata = build_handles(
+            xml_content, file_name
+        )
+        tixi3wrapper, tigl3wrapper = _load_real_bindings()
+
+        if tixi3wrapper is not None and tigl3wrapper is not None:  # pragma: no cover
+            tixi_module = cast(Any, tixi3wrapper)
+            tigl_module = cast(Any, tigl3wrapper)
+
+            tixi_handle: Any = tixi_module.Tixi3()
+            if hasattr(tixi_handle, "openString"):
+                tixi_handle.openString(xml_content)
+            elif hasattr(tixi_handle, "openDocumentFromString"):
+                tixi_handle.openDocumentFromString(xml_content)
             else:
-                tixi_handle, tigl_handle, _, _ = build_handles(xml_content, file_name)
-
-            session_id = session_manager.create_session(
-                tixi_handle, tigl_handle, cpacs_config, xml_content
-            )
-            summary = {
-                "num_wings": len(cpacs_config.wings),
-                "num_fuselages": len(cpacs_config.fuselages),
-                "num_rotors": len(cpacs_config.rotors),
-                "num_engines": len(cpacs_config.engines),
-            }
-            return {
-                "session_id": session_id,
-                "cpacs_metadata": cpacs_stubs.extract_metadata(xml_content, file_name),
-                "configuration_summary": summary,
-            }
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error("OpenError", "Failed to open CPACS", str(exc))
+                raise_mcp_error(
+                    "OpenError",
+                    "No supported TIXI open-from-string API found.",
+                )
+
+            tigl_handle: Any = tigl_module.Tigl3()
+            tigl_handle.open(tixi_handle, "")
+        else:
+            tixi_handle, tigl_handle = stub_tixi, stub_tigl
+
+        session_id = session_manager.create_session(
+            tixi_handle, tigl_handle, cpacs_config, xml_content
+        )
+        summary = {
+            "num_wings": len(cpacs_config.wings),
+            "num_fuselages": len(cpacs_config.fuselages),
+            "num_rotors": len(cpacs_config.rotors),
+            "num_engines": len(cpacs_config.engines),
+        }
+        return {
+            "session_id": session_id,
+            "cpacs_metadata": metadata,
+            "configuration_summary": summary,
+        }
 
     return ToolDefinition(
         name="open_cpacs",
         description="Open a CPACS session from a file path or an XML string.",
         parameters_model=OpenCpacsParams,
         handler=handler,
+        error_type="OpenError",
+        error_message="Failed to open CPACS",
         output_schema={},
     )
 
@@ -109,19 +151,16 @@ def close_cpacs_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the close_cpacs tool definition."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, bool]:
-        try:
-            params = CloseCpacsParams.model_validate(raw_params)
-            session_manager.close(params.session_id)
-            return {"success": True}
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error("CloseError", "Failed to close CPACS", str(exc))
+        params = parse_parameters(CloseCpacsParams, raw_params)
+        session_manager.close(params.session_id)
+        return {"success": True}
 
     return ToolDefinition(
         name="close_cpacs",
         description="Close a CPACS session and free resources.",
         parameters_model=CloseCpacsParams,
         handler=handler,
+        error_type="CloseError",
+        error_message="Failed to close CPACS",
         output_schema={"success": "boolean"},
     )
@@ -2,23 +2,50 @@
 
 from __future__ import annotations
 
-import base64
+import io
 import os
+import re
 import sys
 import tempfile
+import threading
 import types
-from collections.abc import Iterator, Sized
+from collections.abc import Callable, Iterator, Sized
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache, partial
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Literal, NoReturn
-
-from tigl_mcp.cpacs import ComponentDefinition, TiglConfiguration
+from typing import Any, Literal, NoReturn, get_args
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # pragma: no cover - optional SIMD-accelerated encoder
+    from base64 import b64encode
+
+from tigl_mcp.cpacs import (
+    ComponentDefinition,
+    CPACSConfiguration,
+    TiglConfiguration,
+)
 from tigl_mcp.errors import MCPError, raise_mcp_error
-from tigl_mcp.session_manager import SessionManager
-from tigl_mcp.tooling import ToolDefinition, ToolParameters
+from tigl_mcp.session_manager import PayloadCache, SessionManager
+from tigl_mcp.tooling import ToolDefinition, ToolParameters, parse_parameters
 from tigl_mcp.tools.common import format_bounding_box, require_session
 
+
+def _b64encode_text(payload: bytes | memoryview) -> str:
+    """Base64-encode ``payload`` to ASCII text."""
+    encoded: bytes = b64encode(payload)
+    return encoded.decode("ascii")
+
+
 MeshFormat = Literal["stl", "vtk", "collada", "su2"]
+# "text" skips base64 for textual payloads (ASCII STL/VTK, SU2, STEP, IGES),
+# avoiding both the encode pass and its 4/3 size inflation. "artifact" keeps
+# the payload with the session and returns an id for get_export_artifact.
+PayloadEncoding = Literal["base64", "text", "artifact"]
+ArtifactStore = Callable[[bytes], str]
+ExportCache = PayloadCache[tuple[str, str]]
+ExportLock = threading.RLock
 
 
 class ExportMeshParams(ToolParameters):
@@ -28,6 +55,16 @@ class ExportMeshParams(ToolParameters):
     component_uid: str
     format: MeshFormat
     meshing_options: dict[str, float] | None = None
+    encoding: PayloadEncoding = "base64"
+
+
+class ExportMeshesParams(ToolParameters):
+    """Parameters for export_component_meshes."""
+
+    session_id: str
+    format: MeshFormat
+    component_uids: list[str] | None = None  # None exports every component.
+    encoding: PayloadEncoding = "base64"
 
 
 class ExportCadParams(ToolParameters):
@@ -36,13 +73,41 @@ class ExportCadParams(ToolParameters):
     session_id: str
     format: Literal["step", "iges"]
     component_uid: str | None = None  # If set, export only this component (single solid STEP).
+    encoding: PayloadEncoding = "base64"
+    include_cpacs_xml: bool = True  # False skips echoing the CPACS XML back.
+
+
+def _payload_text(payload: bytes, error_type: str) -> str:
+    """Return a textual export payload as-is, rejecting binary content."""
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        raise_mcp_error(
+            error_type,
+            "Export payload is binary and cannot be returned as text; "
+            "request encoding='base64' instead.",
+        )
+
+
+def _encode_payload(
+    payload: bytes,
+    encoding: PayloadEncoding,
+    kind: str,
+    error_type: str,
+    store_artifact: ArtifactStore,
+) -> tuple[str, str]:
+    """Return the response key and encoded value for an export payload."""
+    if encoding == "text":
+        return kind + "_text", _payload_text(payload, error_type)
+    if encoding == "artifact":
+        return kind + "_artifact_id", store_artifact(payload)
+    return kind + "_base64", _b64encode_text(payload)
 
 
 def _count_stl_triangles(mesh_bytes: bytes) -> int | None:
     """Count triangles in an ASCII or binary STL payload."""
-    # ASCII STL
-    text = mesh_bytes.decode("ascii", errors="ignore")
-    ascii_count = text.count("endfacet")
+    # ASCII STL; count on the raw bytes rather than decoding the payload.
+    ascii_count = mesh_bytes.count(b"endfacet")
     if ascii_count > 0:
         return ascii_count
 
@@ -70,21 +135,6 @@ def _looks_like_stl_payload(mesh_bytes: bytes) -> bool:
     return False
 
 
-def _coerce_mesh_bytes(  # pragma: no cover
-    raw_mesh: object, format_label: str
-) -> bytes:
-    """Ensure mesh payloads are bytes, raising on unsupported types."""
-    if isinstance(raw_mesh, bytes):
-        return raw_mesh
-    if isinstance(raw_mesh, str):
-        return raw_mesh.encode("utf-8")
-    raise_mcp_error(
-        "MeshExportError",
-        f"TiGL returned unsupported {format_label} mesh content of type",
-        f" {type(raw_mesh)}",
-    )
-
-
 def _raise_unsupported_format(mesh_format: MeshFormat, component_uid: str) -> NoReturn:
     """Raise a standardized error for unsupported mesh formats."""
     raise_mcp_error(
@@ -96,23 +146,71 @@ def _raise_unsupported_format(mesh_format: MeshFormat, component_uid: str) -> No
     )
 
 
+def _find_component_or_raise(
+    config: CPACSConfiguration, component_uid: str
+) -> ComponentDefinition:
+    """Resolve a component UID, raising NotFound when it is unknown."""
+    component = config.find_component(component_uid)
+    if component is None:
+        raise_mcp_error("NotFound", f"Component '{component_uid}' not found")
+    return component
+
+
+_SUPPORTED_MESH_FORMATS: frozenset[str] = frozenset(get_args(MeshFormat))
+
+
 def _ensure_export_supported(
     tigl_handle: TiglConfiguration, mesh_format: MeshFormat, component_uid: str
 ) -> None:
     """Verify requested mesh export format is supported and fail clearly when not."""
-    supported_native_formats: set[MeshFormat] = {"stl", "vtk", "collada", "su2"}
-    if mesh_format in supported_native_formats:
+    if mesh_format in _SUPPORTED_MESH_FORMATS:
         return
 
     _raise_unsupported_format(mesh_format, component_uid)
 
 
+@cache
+def _meshio() -> types.ModuleType:
+    """Import meshio lazily, once, on the first SU2 export."""
+    return import_module("meshio")
+
+
+class _SU2Cell:
+    """Cell block view accepted by meshio's SU2 writer.
+
+    The writer both unpacks blocks as ``(type, data)`` pairs and reads
+    ``.type``/``.data``/``len()``; meshio's own ``CellBlock`` is not iterable.
+    """
+
+    __slots__ = ("type", "data")
+
+    def __init__(self, cell_type: str, data: Sized) -> None:
+        self.type = cell_type
+        self.data = data
+
+    def __iter__(self) -> Iterator[object]:
+        yield self.type
+        yield self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+_SU2_HEADER_SCAN = 4096
+# Export environment switches, read once at import. Scratch files for
+# exporters that insist on a path (meshio's STL reader, TiGL/OCC writers) go
+# to the default temp dir unless TIGL_MCP_SCRATCH_DIR names another one, e.g.
+# a memory-backed /dev/shm that is large enough for whole-aircraft exports.
+_SCRATCH_DIR = os.environ.get("TIGL_MCP_SCRATCH_DIR") or None
+_DEFAULT_DEFLECTION = float(os.environ.get("TIGL_STL_DEFLECTION", "0.001"))
+_DEBUG_EXPORTS = os.environ.get("TIGL_MCP_DEBUG_EXPORTS") == "1"
+
+
 def _export_su2_via_tigl(
     tigl_handle: TiglConfiguration, component: ComponentDefinition
 ) -> bytes:
-    """Export SU2 mesh bytes using TiGL STL export combined with meshio conversion."""
+    """Export SU2 mesh bytes by converting TiGL's STL export."""
     try:
-        meshio_module: Any = import_module("meshio")
         if _has_real_tigl_exports(tigl_handle):
             stl_bytes = _export_stl_bytes_via_tigl3(tigl_handle, component)
         else:
@@ -130,35 +228,51 @@ def _export_su2_via_tigl(
         raise_mcp_error(
             "MeshExportError", f"TiGL returned empty STL mesh for '{component.uid}'"
         )
+    return _su2_from_stl_bytes(stl_bytes, component)
+
 
+def _su2_from_stl_bytes(stl_bytes: bytes, component: ComponentDefinition) -> bytes:
+    """Convert an exported STL payload to SU2."""
+    # Plain triangle STL (all TiGL produces) converts directly; anything the
+    # direct converter is unsure about still goes through meshio. Imported
+    # here so NumPy only loads once an SU2 export is actually requested.
+    from tigl_mcp.su2 import stl_to_su2_bytes
+
+    su2_bytes = stl_to_su2_bytes(stl_bytes)
+    if su2_bytes is None:
+        su2_bytes = _convert_stl_to_su2_via_meshio(stl_bytes, component)
+
+    # NDIME= belongs to the SU2 header, so only a bounded prefix is searched.
+    if su2_bytes.find(b"NDIME=", 0, _SU2_HEADER_SCAN) < 0:
+        raise_mcp_error(
+            "MeshExportError",
+            f"Conversion to SU2 failed or output invalid for '{component.uid}'",
+        )
+
+    return su2_bytes
+
+
+def _convert_stl_to_su2_via_meshio(
+    stl_bytes: bytes, component: ComponentDefinition
+) -> bytes:
+    """Convert arbitrary STL bytes to SU2 with meshio."""
     try:
-        with tempfile.NamedTemporaryFile(suffix=".stl") as stl_file:
+        meshio_module: Any = _meshio()
+        # meshio's STL reader stats a real path, so the STL side needs a file.
+        with tempfile.NamedTemporaryFile(suffix=".stl", dir=_SCRATCH_DIR) as stl_file:
             stl_file.write(stl_bytes)
             stl_file.flush()
             mesh = meshio_module.read(stl_file.name, file_format="stl")
 
-        class _SU2Cell:
-            def __init__(self, cell_type: str, data: Sized) -> None:
-                self.type = cell_type
-                self.data = data
-
-            def __iter__(self) -> Iterator[object]:
-                yield self.type
-                yield self.data
-
-            def __len__(self) -> int:
-                return len(self.data)
-
         converted_cells = [_SU2Cell(cell.type, cell.data) for cell in mesh.cells]
         mesh_to_write = types.SimpleNamespace(
             points=mesh.points, cells=converted_cells, cell_data=mesh.cell_data
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".su2") as su2_file:
-            meshio_module.write(su2_file.name, mesh_to_write, file_format="su2")
-            su2_file.flush()
-            su2_file.seek(0)
-            su2_bytes = su2_file.read()
+        # The SU2 writer accepts a buffer, so the output never touches disk.
+        su2_buffer = io.BytesIO()
+        meshio_module.write(su2_buffer, mesh_to_write, file_format="su2")
+        return su2_buffer.getvalue()
     except MCPError:
         raise
     except Exception as exc:  # pragma: no cover - defensive path
@@ -168,74 +282,117 @@ def _export_su2_via_tigl(
             str(exc),
         )
 
-    if not su2_bytes or b"NDIME=" not in su2_bytes:
-        raise_mcp_error(
-            "MeshExportError",
-            f"Conversion to SU2 failed or output invalid for '{component.uid}'",
-        )
 
-    return su2_bytes
+_STL_TEMPLATE = (
+    b"solid %(uid)b\n"
+    b"  facet normal 0 0 0\n"
+    b"    outer loop\n"
+    b"      vertex 0 0 0\n"
+    b"      vertex 0 1 0\n"
+    b"      vertex 1 0 0\n"
+    b"    endloop\n"
+    b"  endfacet\n"
+    b"endsolid %(uid)b\n"
+)
+_VTK_TEMPLATE = (
+    b"# vtk DataFile Version 3.0\n"
+    b"component %(uid)b\n"
+    b"ASCII\n"
+    b"DATASET POLYDATA\n"
+    b"POINTS 0 float\n"
+)
+_COLLADA_TEMPLATE = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b"<COLLADA><asset/><library_geometries>"
+    b'<geometry id="%(uid)b" name="%(uid)b"/>'
+    b"</library_geometries></COLLADA>"
+)
+_SYNTHETIC_TEMPLATES: dict[str, bytes] = {
+    "stl": _STL_TEMPLATE,
+    "vtk": _VTK_TEMPLATE,
+    "collada": _COLLADA_TEMPLATE,
+}
 
 
 def _synthetic_mesh_bytes(
     mesh_format: MeshFormat, component: ComponentDefinition
 ) -> bytes:
     """Generate deterministic, format-like mesh payloads for supported formats."""
-    if mesh_format == "stl":
-        return (
-            f"solid {component.uid}\n"
-            "  facet normal 0 0 0\n"
-            "    outer loop\n"
-            "      vertex 0 0 0\n"
-            "      vertex 0 1 0\n"
-            "      vertex 1 0 0\n"
-            "    endloop\n"
-            "  endfacet\n"
-            f"endsolid {component.uid}\n"
-        ).encode("ascii")
-    if mesh_format == "vtk":
-        return (
-            "# vtk DataFile Version 3.0\n"
-            f"component {component.uid}\n"
-            "ASCII\n"
-            "DATASET POLYDATA\n"
-            "POINTS 0 float\n"
-        ).encode("ascii")
-    if mesh_format == "collada":
-        return (
-            '<?xml version="1.0" encoding="UTF-8"?>'
-            "<COLLADA><asset/><library_geometries>"
-            f'<geometry id="{component.uid}" name="{component.uid}"/>'
-            "</library_geometries></COLLADA>"
-        ).encode("ascii")
-
-    _raise_unsupported_format(mesh_format, component.uid)
+    if mesh_format not in _SYNTHETIC_TEMPLATES:
+        _raise_unsupported_format(mesh_format, component.uid)
+    return _filled_template(mesh_format, component.uid_bytes)
+
+
+@lru_cache(maxsize=256)
+def _filled_template(mesh_format: str, uid_bytes: bytes) -> bytes:
+    """Fill a precompiled byte template with a pre-encoded UID, memoized."""
+    return _SYNTHETIC_TEMPLATES[mesh_format] % {b"uid": uid_bytes}
+
+
+_REAL_EXPORT_METHODS = (
+    "exportMeshedWingSTL",
+    "exportMeshedGeometrySTL",
+    "exportFusedSTEP",
+)
+_CAD_EXPORT_METHODS = ("exportFusedSTEP", "exportSTEP", "exportConfiguration", "export")
+
+
+_CLASS_CAPABILITIES: dict[tuple[type, tuple[str, ...]], bool] = {}
+
+
+def _class_exposes(handle_type: type, method_names: tuple[str, ...]) -> bool:
+    """Check (once per handle class) whether any of ``method_names`` is callable.
+
+    Export capabilities are methods of the TiGL binding or stub class, so the
+    attribute scan is keyed on the class rather than repeated per request.
+    """
+    key = (handle_type, method_names)
+    exposed = _CLASS_CAPABILITIES.get(key)
+    if exposed is None:
+        exposed = any(
+            callable(getattr(handle_type, name, None)) for name in method_names
+        )
+        _CLASS_CAPABILITIES[key] = exposed
+    return exposed
+
+
+_EXPORTISH_RE = re.compile(r"export|step|iges|stp|stl|write|save|mesh", re.IGNORECASE)
+
+
+_EXPORT_METHOD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _export_method_names(handle_type: type) -> tuple[str, ...]:
+    """List (once per handle class) the attribute names that look export-related."""
+    names = _EXPORT_METHOD_NAMES.get(handle_type)
+    if names is None:
+        names = tuple(name for name in dir(handle_type) if _EXPORTISH_RE.search(name))
+        _EXPORT_METHOD_NAMES[handle_type] = names
+    return names
+
+
+def _debug_log_export_methods(tigl_handle: object) -> None:
+    """Print the handle's export-like methods when TIGL_MCP_DEBUG_EXPORTS=1."""
+    if not _DEBUG_EXPORTS:
+        return
+    methods = list(_export_method_names(type(tigl_handle)))
+    print(
+        f"[tigl-mcp][debug] tigl_handle export-ish methods: {methods}",
+        file=sys.stderr,
+        flush=True,
+    )
 
 
 def _has_real_tigl_exports(tigl_handle: object) -> bool:
     """Check whether the handle has real TiGL export methods (vs stub)."""
-    export_methods = (
-        "exportMeshedWingSTL",
-        "exportMeshedGeometrySTL",
-        "exportFusedSTEP",
-    )
-    return any(callable(getattr(tigl_handle, name, None)) for name in export_methods)
+    return _class_exposes(type(tigl_handle), _REAL_EXPORT_METHODS)
 
 
 def _export_real_stl_bytes(
     tigl_handle: object, component: ComponentDefinition
 ) -> bytes:  # pragma: no cover
     """Export real STL bytes via TiGL meshed export methods."""
-    if os.environ.get("TIGL_MCP_DEBUG_EXPORTS") == "1":
-        keys = ("export", "step", "iges", "stp", "stl", "write", "save", "mesh")
-        methods = [
-            name for name in dir(tigl_handle) if any(k in name.lower() for k in keys)
-        ]
-        print(
-            f"[tigl-mcp][debug] tigl_handle export-ish methods: {methods}",
-            file=sys.stderr,
-            flush=True,
-        )
+    _debug_log_export_methods(tigl_handle)
 
     errors: list[str] = []
 
@@ -254,114 +411,304 @@ def _export_real_stl_bytes(
     )
 
 
-def _export_mesh_bytes(
-    tigl_handle: TiglConfiguration,
-    component: ComponentDefinition,
-    mesh_format: MeshFormat,
+def _export_stl_bytes(
+    tigl_handle: TiglConfiguration, component: ComponentDefinition
 ) -> bytes:
-    """Export mesh content for the requested format."""
-    if mesh_format == "su2":
-        return _export_su2_via_tigl(tigl_handle, component)
-
-    if mesh_format == "stl" and _has_real_tigl_exports(tigl_handle):
+    """Export STL through real TiGL bindings, or the synthetic stand-in."""
+    if _has_real_tigl_exports(tigl_handle):
         return _export_real_stl_bytes(tigl_handle, component)
+    return _synthetic_mesh_bytes("stl", component)
+
 
-    return _synthetic_mesh_bytes(mesh_format, component)
+# Formats with a dedicated export route; the rest use synthetic payloads.
+_MESH_EXPORTERS: dict[
+    str, Callable[[TiglConfiguration, ComponentDefinition], bytes]
+] = {
+    "su2": _export_su2_via_tigl,
+    "stl": _export_stl_bytes,
+}
+
+
+_HANDLE_PREFIXES = (b"mesh:", b"su2-from-stl:")
 
 
 def _looks_like_handle(mesh_bytes: bytes) -> bool:
     """Detect legacy handle payloads masquerading as mesh bytes."""
-    try:
-        mesh_text = mesh_bytes.decode("ascii")
-    except UnicodeDecodeError:
-        return False
-    return mesh_text.startswith("mesh:") or mesh_text.startswith("su2-from-stl:")
+    # Only the prefix matters, so never decode the (possibly huge) payload.
+    return mesh_bytes.startswith(_HANDLE_PREFIXES)
 
 
-def _validate_mesh_bytes(
-    mesh_bytes: bytes, mesh_format: MeshFormat, component: ComponentDefinition
+def _export_mesh_bytes(
+    tigl_handle: TiglConfiguration,
+    component: ComponentDefinition,
+    mesh_format: MeshFormat,
 ) -> bytes:
-    """Ensure exported mesh payloads are real, non-empty bytes."""
-    if mesh_bytes is None or len(mesh_bytes) == 0:
+    """Export validated mesh content for the requested format.
+
+    Synthetic payloads are built from known-good templates and returned as is;
+    only bytes produced by a dedicated export route are checked here (the SU2
+    route already verifies its own ``NDIME=`` header).
+    """
+    exporter = _MESH_EXPORTERS.get(mesh_format)
+    if exporter is None:
+        return _synthetic_mesh_bytes(mesh_format, component)
+
+    mesh_bytes = exporter(tigl_handle, component)
+    if not mesh_bytes or _looks_like_handle(mesh_bytes):
         _raise_unsupported_format(mesh_format, component.uid)
+    return mesh_bytes
 
-    if _looks_like_handle(mesh_bytes):
-        _raise_unsupported_format(mesh_format, component.uid)
 
-    if mesh_format == "su2" and b"NDIME=" not in mesh_bytes:
-        raise_mcp_error(
-            "MeshExportError",
-            f"Conversion to SU2 failed or output invalid for '{component.uid}'",
+def _cached_export(
+    export_cache: ExportCache,
+    export_lock: ExportLock,
+    key: tuple[str, str],
+    export: Callable[[], bytes],
+) -> bytes:
+    """Return the cached payload for ``key``, running ``export`` on a miss.
+
+    Misses are filled under the session's ``export_lock``, so concurrent
+    callers never export the same payload twice or drive TiGL in parallel.
+    """
+    payload = export_cache.get(key)
+    if payload is not None:
+        return payload
+    with export_lock:
+        payload = export_cache.get(key)
+        if payload is None:
+            payload = export()
+            export_cache.put(key, payload)
+    return payload
+
+
+def _cached_mesh_bytes(
+    tigl_handle: TiglConfiguration,
+    component: ComponentDefinition,
+    mesh_format: MeshFormat,
+    export_cache: ExportCache,
+    export_lock: ExportLock,
+) -> bytes:
+    """Export a mesh, reusing the session's earlier real TiGL output."""
+    # Synthetic payloads are cheap to rebuild; only real meshing (and the SU2
+    # conversion of its output) is worth keeping per session.
+    if not _has_real_tigl_exports(tigl_handle):
+        return _export_mesh_bytes(tigl_handle, component, mesh_format)
+
+    def export_su2_from_cached_stl() -> bytes:
+        # SU2 is converted from the component's STL, so share that export:
+        # asking for both formats meshes the component only once.
+        stl_bytes = _cached_mesh_bytes(
+            tigl_handle, component, "stl", export_cache, export_lock
         )
+        return _su2_from_stl_bytes(stl_bytes, component)
 
-    return mesh_bytes
+    export: Callable[[], bytes] = partial(
+        _export_mesh_bytes, tigl_handle, component, mesh_format
+    )
+    if mesh_format == "su2":
+        export = export_su2_from_cached_stl
+    return _cached_export(
+        export_cache, export_lock, (component.uid, mesh_format), export
+    )
+
+
+def _mesh_response(
+    tigl_handle: TiglConfiguration,
+    component: ComponentDefinition,
+    mesh_format: MeshFormat,
+    encoding: PayloadEncoding,
+    store_artifact: ArtifactStore,
+    export_cache: ExportCache,
+    export_lock: ExportLock,
+) -> dict[str, object]:
+    """Export one component mesh and build its tool response."""
+    mesh_bytes = _cached_mesh_bytes(
+        tigl_handle, component, mesh_format, export_cache, export_lock
+    )
+    payload_key, payload = _encode_payload(
+        mesh_bytes, encoding, "mesh", "MeshExportError", store_artifact
+    )
+    # Build the response in one dict display instead of key-by-key.
+    result: dict[str, object] = {
+        "format": mesh_format,
+        payload_key: payload,
+        "bounding_box": format_bounding_box(component.bounding_box),
+    }
+    tri_count = _count_stl_triangles(mesh_bytes)
+    if tri_count is not None:
+        result["num_triangles"] = tri_count
+
+    return result
 
 
 def export_component_mesh_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the export_component_mesh tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = ExportMeshParams.model_validate(raw_params)
-            _, tigl_handle, config = require_session(session_manager, params.session_id)
-            if os.environ.get("TIGL_MCP_DEBUG_EXPORTS") == "1":
-                keys = ("export", "step", "iges", "stp", "stl", "write", "save", "mesh")
-                methods = [
-                    name
-                    for name in dir(tigl_handle)
-                    if any(k in name.lower() for k in keys)
-                ]
-                print(
-                    f"[tigl-mcp][debug] tigl_handle export-ish methods: {methods}",
-                    file=sys.stderr,
-                    flush=True,
-                )
+        params = parse_parameters(ExportMeshParams, raw_params)
+        _, tigl_handle, config = require_session(session_manager, params.session_id)
+        _debug_log_export_methods(tigl_handle)
+
+        component = _find_component_or_raise(config, params.component_uid)
+        _ensure_export_supported(
+            tigl_handle=tigl_handle,
+            mesh_format=params.format,
+            component_uid=params.component_uid,
+        )
+        return _mesh_response(
+            tigl_handle,
+            component,
+            params.format,
+            params.encoding,
+            partial(session_manager.store_artifact, params.session_id),
+            session_manager.export_cache(params.session_id),
+            session_manager.export_lock(params.session_id),
+        )
+
+    return ToolDefinition(
+        name="export_component_mesh",
+        description=(
+            "Export a component mesh as base64-encoded content, as plain "
+            "text for textual formats when encoding='text', or as an id for "
+            "get_export_artifact when encoding='artifact'."
+        ),
+        parameters_model=ExportMeshParams,
+        handler=handler,
+        error_type="MeshExportError",
+        error_message="Failed to export component mesh",
+        output_schema={},
+    )
+
+
+# Upper bound on threads one batch export may occupy. TiGL exports still run
+# one at a time under the session's export lock; the extra threads only
+# overlap encoding and SU2 conversion with them.
+_MAX_EXPORT_WORKERS = min(8, os.cpu_count() or 1)
 
-            component = config.find_component(params.component_uid)
-            if component is None:
-                raise_mcp_error(
-                    "NotFound", f"Component '{params.component_uid}' not found"
-                )
 
+def export_component_meshes_tool(session_manager: SessionManager) -> ToolDefinition:
+    """Create the export_component_meshes tool."""
+
+    def handler(raw_params: dict[str, object]) -> dict[str, object]:
+        params = parse_parameters(ExportMeshesParams, raw_params)
+        _, tigl_handle, config = require_session(session_manager, params.session_id)
+
+        if params.component_uids is None:
+            components = config.all_components()
+        else:
+            components = tuple(
+                _find_component_or_raise(config, uid)
+                for uid in dict.fromkeys(params.component_uids)
+            )
+        # Support depends only on the format, so one check covers the batch.
+        if components:
             _ensure_export_supported(
                 tigl_handle=tigl_handle,
                 mesh_format=params.format,
-                component_uid=params.component_uid,
+                component_uid=components[0].uid,
             )
-            mesh_bytes = _export_mesh_bytes(
-                tigl_handle=tigl_handle,
-                component=component,
-                mesh_format=params.format,
+
+        store_artifact = partial(session_manager.store_artifact, params.session_id)
+        export_cache = session_manager.export_cache(params.session_id)
+        export_lock = session_manager.export_lock(params.session_id)
+
+        def export(component: ComponentDefinition) -> dict[str, object]:
+            return _mesh_response(
+                tigl_handle,
+                component,
+                params.format,
+                params.encoding,
+                store_artifact,
+                export_cache,
+                export_lock,
             )
-            validated_mesh = _validate_mesh_bytes(mesh_bytes, params.format, component)
-            mesh_base64 = base64.b64encode(validated_mesh).decode("utf-8")
-
-            result: dict[str, object] = {
-                "format": params.format,
-                "mesh_base64": mesh_base64,
-                "bounding_box": format_bounding_box(component.bounding_box),
-            }
-            tri_count = _count_stl_triangles(validated_mesh)
-            if tri_count is not None:
-                result["num_triangles"] = tri_count
-
-            return result
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
+
+        # TiGL calls on the shared handle are serialized by the session's
+        # export lock; the threads overlap encoding, triangle counting and
+        # SU2 conversion of finished meshes with the next TiGL export. The
+        # synthetic path is cheap pure Python and stays serial.
+        if len(components) > 1 and _has_real_tigl_exports(tigl_handle):
+            workers = min(len(components), _MAX_EXPORT_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = list(pool.map(export, components))
+        else:
+            responses = [export(component) for component in components]
+
+        return {
+            "format": params.format,
+            "meshes": {
+                component.uid: response
+                for component, response in zip(components, responses, strict=True)
+            },
+        }
+
+    return ToolDefinition(
+        name="export_component_meshes",
+        description=(
+            "Export meshes for several components (all by default), keyed by "
+            "component UID, using the same payloads as export_component_mesh."
+        ),
+        parameters_model=ExportMeshesParams,
+        handler=handler,
+        error_type="MeshExportError",
+        error_message="Failed to export component meshes",
+        output_schema={},
+    )
+
+
+class GetExportArtifactParams(ToolParameters):
+    """Parameters for get_export_artifact."""
+
+    session_id: str
+    artifact_id: str
+    offset: int = 0
+    length: int | None = None
+
+
+def get_export_artifact_tool(session_manager: SessionManager) -> ToolDefinition:
+    """Create the get_export_artifact tool."""
+
+    def handler(raw_params: dict[str, object]) -> dict[str, object]:
+        params = parse_parameters(GetExportArtifactParams, raw_params)
+        if params.offset < 0 or (params.length is not None and params.length < 1):
             raise_mcp_error(
-                "MeshExportError", "Failed to export component mesh", str(exc)
+                "InvalidInput", "offset must be >= 0 and length must be >= 1"
             )
+        artifact = session_manager.get_artifact(params.session_id, params.artifact_id)
+        end = len(artifact) if params.length is None else params.offset + params.length
+        # Slice through a memoryview so chunked reads do not copy the artifact.
+        with memoryview(artifact) as view:
+            chunk = _b64encode_text(view[params.offset : end])
+        return {
+            "artifact_id": params.artifact_id,
+            "size": len(artifact),
+            "offset": params.offset,
+            "data_base64": chunk,
+        }
 
     return ToolDefinition(
-        name="export_component_mesh",
-        description="Export a component mesh as base64-encoded content.",
-        parameters_model=ExportMeshParams,
+        name="get_export_artifact",
+        description=(
+            "Fetch an export payload stored with encoding='artifact' as base64, "
+            "optionally one offset/length chunk at a time."
+        ),
+        parameters_model=GetExportArtifactParams,
         handler=handler,
+        error_type="ExportArtifactError",
+        error_message="Failed to read export artifact",
         output_schema={},
     )
 
 
+def _written_size(path: Path) -> int:
+    """Return the size of an exporter's output file, or 0 if none was written."""
+    # One stat call instead of exists() followed by stat().
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
 def _make_closed_solid_step(  # pragma: no cover
     tigl_handle: object, out_path: Path
 ) -> bool:
@@ -448,7 +795,7 @@ def _make_closed_solid_step(  # pragma: no cover
     writer = STEPControl_Writer()
     writer.Transfer(fused, STEPControl_AsIs)
     status = writer.Write(str(out_path))
-    return status == 1 and out_path.exists() and out_path.stat().st_size > 0
+    return status == 1 and _written_size(out_path) > 0
 
 
 def _make_single_component_step(  # pragma: no cover
@@ -542,7 +889,7 @@ def _make_single_component_step(  # pragma: no cover
     writer = STEPControl_Writer()
     writer.Transfer(fused, STEPControl_AsIs)
     status = writer.Write(str(out_path))
-    return status == 1 and out_path.exists() and out_path.stat().st_size > 0
+    return status == 1 and _written_size(out_path) > 0
 
 
 def _export_single_component_cad(
@@ -556,7 +903,9 @@ def _export_single_component_cad(
             "CadExportError",
             "Single-component export is only supported for format 'step'.",
         )
-    with tempfile.NamedTemporaryFile(suffix=".step", delete=False) as file_obj:
+    with tempfile.NamedTemporaryFile(
+        suffix=".step", delete=False, dir=_SCRATCH_DIR
+    ) as file_obj:
         out_path = Path(file_obj.name)
     try:
         out_path.unlink(missing_ok=True)
@@ -570,13 +919,49 @@ def _export_single_component_cad(
         out_path.unlink(missing_ok=True)
 
 
+# Per format: exporter names tried in order (the first one that writes a file
+# wins) and the scratch file suffix.
+_CAD_FORMAT_EXPORTERS: dict[str, tuple[tuple[str, ...], str]] = {
+    "step": (
+        ("exportFusedSTEP", "exportSTEP", "exportFusedStep", "exportStep"),
+        ".step",
+    ),
+    "iges": (
+        ("exportFusedIGES", "exportIGES", "exportFusedIges", "exportIges"),
+        ".iges",
+    ),
+}
+_CAD_GENERIC_EXPORTERS = ("exportConfiguration", "exportconfiguration", "export")
+_CLASS_METHODS: dict[tuple[type, tuple[str, ...]], tuple[str, ...]] = {}
+
+
+def _class_methods(handle_type: type, method_names: tuple[str, ...]) -> tuple[str, ...]:
+    """Drop (once per handle class) the names the class does not define.
+
+    Only missing methods are remembered; the remaining names keep their
+    priority order, so every session tries the same exporters in turn.
+    """
+    key = (handle_type, method_names)
+    present = _CLASS_METHODS.get(key)
+    if present is None:
+        present = tuple(
+            name for name in method_names if callable(getattr(handle_type, name, None))
+        )
+        _CLASS_METHODS[key] = present
+    return present
+
+
 def _export_configuration_cad_bytes_via_tigl(
     tigl_handle: object, cad_format: str
 ) -> bytes:  # pragma: no cover
     """Export full-aircraft CAD bytes using available TiGL methods."""
-    suffix = ".step" if cad_format == "step" else ".iges"
+    format_exporters, suffix = _CAD_FORMAT_EXPORTERS[
+        "step" if cad_format == "step" else "iges"
+    ]
 
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as file_obj:
+    with tempfile.NamedTemporaryFile(
+        suffix=suffix, delete=False, dir=_SCRATCH_DIR
+    ) as file_obj:
         out_path = Path(file_obj.name)
 
     try:
@@ -585,25 +970,12 @@ def _export_configuration_cad_bytes_via_tigl(
         if cad_format == "step" and _make_closed_solid_step(tigl_handle, out_path):
             return out_path.read_bytes()
 
-        if cad_format == "step":
-            candidates = [
-                "exportFusedSTEP",
-                "exportSTEP",
-                "exportFusedStep",
-                "exportStep",
-            ]
-        else:
-            candidates = [
-                "exportFusedIGES",
-                "exportIGES",
-                "exportFusedIges",
-                "exportIges",
-            ]
+        handle_type = type(tigl_handle)
 
         tried: list[str] = []
         errors: list[str] = []
 
-        for name in candidates:
+        for name in _class_methods(handle_type, format_exporters):
             fn = getattr(tigl_handle, name, None)
             if not callable(fn):
                 continue
@@ -621,10 +993,10 @@ def _export_configuration_cad_bytes_via_tigl(
                 errors.append(f"{name}: {type(exc).__name__}: {exc}")
                 continue
 
-            if out_path.exists() and out_path.stat().st_size > 0:
+            if _written_size(out_path) > 0:
                 return out_path.read_bytes()
 
-        for name in ["exportConfiguration", "exportconfiguration", "export"]:
+        for name in _class_methods(handle_type, _CAD_GENERIC_EXPORTERS):
             fn = getattr(tigl_handle, name, None)
             if not callable(fn):
                 continue
@@ -632,7 +1004,7 @@ def _export_configuration_cad_bytes_via_tigl(
             tried.append(name)
             try:
                 fn(str(out_path))
-                if out_path.exists() and out_path.stat().st_size > 0:
+                if _written_size(out_path) > 0:
                     return out_path.read_bytes()
             except Exception as exc:
                 errors.append(f"{name}: {type(exc).__name__}: {exc}")
@@ -646,72 +1018,81 @@ def _export_configuration_cad_bytes_via_tigl(
         out_path.unlink(missing_ok=True)
 
 
+_STUB_CAD_PREFIXES = {"step": b"cad:step:", "iges": b"cad:iges:"}
+
+
 def export_configuration_cad_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the export_configuration_cad tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = ExportCadParams.model_validate(raw_params)
-            tixi_handle, tigl_handle, config = require_session(
-                session_manager, params.session_id
-            )
+        params = parse_parameters(ExportCadParams, raw_params)
+        tixi_handle, tigl_handle, config = require_session(
+            session_manager, params.session_id
+        )
 
-            cpacs_xml = session_manager.get_cpacs_xml(params.session_id)
-            if not cpacs_xml:
-                cpacs_xml = getattr(tixi_handle, "xml_content", "") or ""
-            cpacs_xml_base64 = base64.b64encode(cpacs_xml.encode("utf-8")).decode(
-                "utf-8"
-            )
+        cpacs_xml = session_manager.get_cpacs_xml(params.session_id)
+        if not cpacs_xml:
+            cpacs_xml = getattr(tixi_handle, "xml_content", "") or ""
 
-            export_capable = any(
-                callable(getattr(tigl_handle, name, None))
-                for name in (
-                    "exportFusedSTEP",
-                    "exportSTEP",
-                    "exportConfiguration",
-                    "export",
-                )
-            )
+        export_capable = _class_exposes(type(tigl_handle), _CAD_EXPORT_METHODS)
+        export_cache = session_manager.export_cache(params.session_id)
+        export_lock = session_manager.export_lock(params.session_id)
+        # An empty UID keys the whole-configuration export.
+        cache_key = (params.component_uid or "", params.format)
 
-            if params.component_uid and export_capable:
-                component = config.find_component(params.component_uid)
-                if component is None:
-                    raise_mcp_error(
-                        "NotFound",
-                        f"Component '{params.component_uid}' not found.",
-                    )
-                cad_bytes = _export_single_component_cad(
-                    tigl_handle, component, params.format
-                )
-                source = "tigl_single_component"
-            elif export_capable:
-                cad_bytes = _export_configuration_cad_bytes_via_tigl(
-                    tigl_handle, params.format
+        if params.component_uid and export_capable:
+            component = config.find_component(params.component_uid)
+            if component is None:
+                raise_mcp_error(
+                    "NotFound",
+                    f"Component '{params.component_uid}' not found.",
                 )
-                source = "tigl"
-            else:
-                cad_bytes = f"cad:{params.format}:{cpacs_xml}".encode()
-                source = "stub"
-
-            cad_base64 = base64.b64encode(cad_bytes).decode("utf-8")
-            return {
-                "format": params.format,
-                "cad_base64": cad_base64,
-                "source": source,
-                "cpacs_xml_base64": cpacs_xml_base64,
-            }
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "CadExportError", "Failed to export configuration", str(exc)
+            cad_bytes = _cached_export(
+                export_cache,
+                export_lock,
+                cache_key,
+                partial(
+                    _export_single_component_cad, tigl_handle, component, params.format
+                ),
+            )
+            source = "tigl_single_component"
+        elif export_capable:
+            cad_bytes = _cached_export(
+                export_cache,
+                export_lock,
+                cache_key,
+                partial(
+                    _export_configuration_cad_bytes_via_tigl, tigl_handle, params.format
+                ),
             )
+            source = "tigl"
+        else:
+            cad_bytes = _STUB_CAD_PREFIXES[params.format] + cpacs_xml.encode("utf-8")
+            source = "stub"
+
+        payload_key, payload = _encode_payload(
+            cad_bytes,
+            params.encoding,
+            "cad",
+            "CadExportError",
+            partial(session_manager.store_artifact, params.session_id),
+        )
+        result: dict[str, object] = {
+            "format": params.format,
+            payload_key: payload,
+            "source": source,
+        }
+        if params.include_cpacs_xml:
+            result["cpacs_xml_base64"] = _b64encode_text(cpacs_xml.encode("utf-8"))
+        return result
 
     return ToolDefinition(
         name="export_configuration_cad",
         description="Export the full configuration CAD (or a single component when component_uid is set) and return it encoded.",
         parameters_model=ExportCadParams,
         handler=handler,
+        error_type="CadExportError",
+        error_message="Failed to export configuration",
         output_schema={},
     )
 
@@ -719,21 +1100,73 @@ def export_configuration_cad_tool(session_manager: SessionManager) -> ToolDefini
 def _uid_candidates(component: ComponentDefinition) -> list[str]:  # pragma: no cover
     """Return UID variants to try when calling TiGL export methods."""
     uid = component.uid
-    candidates = [uid, uid.replace("_", ""), uid.replace("_", "").title()]
-    seen: set[str] = set()
-    result: list[str] = []
-    for candidate in candidates:
-        if candidate and candidate not in seen:
-            seen.add(candidate)
-            result.append(candidate)
-    return result
+    compact = uid.replace("_", "")
+    # dict.fromkeys de-duplicates while keeping the preferred order.
+    return [
+        candidate
+        for candidate in dict.fromkeys((uid, compact, compact.title()))
+        if candidate
+    ]
+
+
+# Component-level meshed STL exporters per component kind, in preference
+# order, with how each addresses the component.
+_STL_ROUTES: dict[str, tuple[tuple[str, Literal["uid", "index"]], ...]] = {
+    "wing": (
+        ("exportMeshedWingSTLByUID", "uid"),
+        ("exportMeshedWingSTL", "index"),
+    ),
+    "fuselage": (
+        ("exportMeshedFuselageSTLByUID", "uid"),
+        ("exportMeshedFuselageSTL", "index"),
+    ),
+}
+# (handle class, method, argument count) calls rejected with a TypeError,
+# i.e. signatures the binding does not accept; they are not tried again.
+_FAILING_STL_CALLS: set[tuple[type, str, int]] = set()
+
+
+def _stl_export_calls(  # pragma: no cover
+    handle_type: type,
+    component: ComponentDefinition,
+    stl_path: str,
+    deflection: float,
+) -> Iterator[tuple[str, tuple[object, ...]]]:
+    """Yield the (method, args) calls worth trying for ``component``.
+
+    Methods the handle class does not expose and signatures it has rejected
+    before are pruned up front. The deflection (3-argument) form is always
+    tried before the 2-argument one, so ``TIGL_STL_DEFLECTION`` applies
+    wherever the binding accepts it.
+    """
+    for kind, routes in _STL_ROUTES.items():
+        if kind not in component.type_name_lower:
+            continue
+        for method, addressing in routes:
+            if not _class_exposes(handle_type, (method,)):
+                continue
+            keys: list[object] = (
+                list(_uid_candidates(component))
+                if addressing == "uid"
+                else [int(component.index)]
+            )
+            arities = [
+                arity
+                for arity in (3, 2)
+                if (handle_type, method, arity) not in _FAILING_STL_CALLS
+            ]
+            for key in keys:
+                for arity in arities:
+                    yield method, (key, stl_path, deflection)[:arity]
 
 
 def _export_stl_bytes_via_tigl3(  # pragma: no cover
     tigl: object, component: ComponentDefinition
 ) -> bytes:
     """Export STL bytes from TiGL meshed export methods using UID/index fallbacks."""
-    with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as file_obj:
+    with tempfile.NamedTemporaryFile(
+        suffix=".stl", delete=False, dir=_SCRATCH_DIR
+    ) as file_obj:
         stl_path = Path(file_obj.name)
 
     errors: list[str] = []
@@ -754,51 +1187,21 @@ def _export_stl_bytes_via_tigl3(  # pragma: no cover
                 )
             else:
                 errors.append(f"{method}{args} produced no file")
+        except TypeError as exc:
+            # The binding rejected this signature; skip it from now on.
+            _FAILING_STL_CALLS.add((type(tigl), method, len(args)))
+            errors.append(f"{method}{args} {type(exc).__name__}: {exc}")
         except Exception as exc:
             errors.append(f"{method}{args} {type(exc).__name__}: {exc}")
         return None
 
     try:
-        component_type = (component.type_name or "").lower()
-        uid_list = _uid_candidates(component)
-        index = int(component.index)
-        deflection = float(os.environ.get("TIGL_STL_DEFLECTION", "0.001"))
-
-        if "wing" in component_type:
-            for uid in uid_list:
-                for method, args in [
-                    ("exportMeshedWingSTLByUID", (uid, str(stl_path), deflection)),
-                    ("exportMeshedWingSTLByUID", (uid, str(stl_path))),
-                ]:
-                    out = _try(method, *args)
-                    if out is not None:
-                        return out
-
-            for method, args in [
-                ("exportMeshedWingSTL", (index, str(stl_path), deflection)),
-                ("exportMeshedWingSTL", (index, str(stl_path))),
-            ]:
-                out = _try(method, *args)
-                if out is not None:
-                    return out
-
-        if "fuselage" in component_type:
-            for uid in uid_list:
-                for method, args in [
-                    ("exportMeshedFuselageSTLByUID", (uid, str(stl_path), deflection)),
-                    ("exportMeshedFuselageSTLByUID", (uid, str(stl_path))),
-                ]:
-                    out = _try(method, *args)
-                    if out is not None:
-                        return out
-
-            for method, args in [
-                ("exportMeshedFuselageSTL", (index, str(stl_path), deflection)),
-                ("exportMeshedFuselageSTL", (index, str(stl_path))),
-            ]:
-                out = _try(method, *args)
-                if out is not None:
-                    return out
+        for method, args in _stl_export_calls(
+            type(tigl), component, str(stl_path), _DEFAULT_DEFLECTION
+        ):
+            out = _try(method, *args)
+            if out is not None:
+                return out
 
         if callable(getattr(tigl, "exportMeshedGeometrySTL", None)):
             errors.append(
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from tigl_mcp.cpacs import ComponentDefinition, CPACSConfiguration
-from tigl_mcp.errors import MCPError, raise_mcp_error
+from tigl_mcp.errors import raise_mcp_error
 from tigl_mcp.session_manager import SessionManager
-from tigl_mcp.tooling import ToolDefinition, ToolParameters
+from tigl_mcp.tooling import ToolDefinition, ToolParameters, parse_parameters
 from tigl_mcp.tools.common import require_session
 
 
@@ -37,51 +37,49 @@ def get_wing_summary_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the get_wing_summary tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = WingSummaryParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            component = _safe_get_component(config, params.wing_uid, "Wing")
-            span = component.parameters.get("span", 20.0 + component.index)
-            reference_area = component.parameters.get("area", span * 0.8)
-            half_span = span / 2.0
-            top_area = reference_area * 0.5 if reference_area else None
-            aspect_ratio = (span**2) / reference_area if reference_area else None
-            mac_length = component.parameters.get("mac_length")
-            sweep = component.parameters.get("sweep")
-            dihedral = component.parameters.get("dihedral")
-            mac_quarter_chord = {
-                "x": component.bounding_box.xmin
-                + 0.25 * (component.bounding_box.xmax - component.bounding_box.xmin),
-                "y": component.bounding_box.ymin
-                + 0.25 * (component.bounding_box.ymax - component.bounding_box.ymin),
-                "z": component.bounding_box.zmin
-                + 0.25 * (component.bounding_box.zmax - component.bounding_box.zmin),
-            }
-            return {
-                "span": span,
-                "half_span": half_span,
-                "reference_area": reference_area,
-                "wetted_area": component.parameters.get("wetted_area"),
-                "top_area": top_area,
-                "aspect_ratio": aspect_ratio,
-                "mac_length": mac_length,
-                "mac_quarter_chord": mac_quarter_chord,
-                "sweep_deg": sweep,
-                "dihedral_deg": dihedral,
-                "symmetry": component.symmetry,
-            }
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "WingSummaryError", "Failed to compute wing summary", str(exc)
-            )
+        params = parse_parameters(WingSummaryParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        component = _safe_get_component(config, params.wing_uid, "Wing")
+        # Defaults are only computed when the parameter is actually missing.
+        span = component.parameters.get("span")
+        if span is None:
+            span = 20.0 + component.index
+        reference_area = component.parameters.get("area")
+        if reference_area is None:
+            reference_area = span * 0.8
+        half_span = span / 2.0
+        top_area = reference_area * 0.5 if reference_area else None
+        aspect_ratio = (span**2) / reference_area if reference_area else None
+        mac_length = component.parameters.get("mac_length")
+        sweep = component.parameters.get("sweep")
+        dihedral = component.parameters.get("dihedral")
+        box = component.bounding_box
+        mac_quarter_chord = {
+            "x": box.xmin + 0.25 * (box.xmax - box.xmin),
+            "y": box.ymin + 0.25 * (box.ymax - box.ymin),
+            "z": box.zmin + 0.25 * (box.zmax - box.zmin),
+        }
+        return {
+            "span": span,
+            "half_span": half_span,
+            "reference_area": reference_area,
+            "wetted_area": component.parameters.get("wetted_area"),
+            "top_area": top_area,
+            "aspect_ratio": aspect_ratio,
+            "mac_length": mac_length,
+            "mac_quarter_chord": mac_quarter_chord,
+            "sweep_deg": sweep,
+            "dihedral_deg": dihedral,
+            "symmetry": component.symmetry,
+        }
 
     return ToolDefinition(
         name="get_wing_summary",
         description="Return key geometric metrics for a wing.",
         parameters_model=WingSummaryParams,
         handler=handler,
+        error_type="WingSummaryError",
+        error_message="Failed to compute wing summary",
         output_schema={},
     )
 
@@ -90,33 +88,30 @@ def get_fuselage_summary_tool(session_manager: SessionManager) -> ToolDefinition
     """Create the get_fuselage_summary tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = FuselageSummaryParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            component = _safe_get_component(config, params.fuselage_uid, "Fuselage")
-            length = component.parameters.get("length", 15.0 + component.index)
-            wetted_area = component.parameters.get("wetted_area")
-            max_cross_section_area = component.parameters.get("max_cross_section_area")
-            max_diameter = component.parameters.get("max_diameter")
-            approx_volume = component.parameters.get("volume")
-            return {
-                "length": length,
-                "wetted_area": wetted_area,
-                "max_cross_section_area": max_cross_section_area,
-                "max_diameter": max_diameter,
-                "approx_volume": approx_volume,
-            }
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "FuselageSummaryError", "Failed to compute fuselage summary", str(exc)
-            )
+        params = parse_parameters(FuselageSummaryParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        component = _safe_get_component(config, params.fuselage_uid, "Fuselage")
+        length = component.parameters.get("length")
+        if length is None:
+            length = 15.0 + component.index
+        wetted_area = component.parameters.get("wetted_area")
+        max_cross_section_area = component.parameters.get("max_cross_section_area")
+        max_diameter = component.parameters.get("max_diameter")
+        approx_volume = component.parameters.get("volume")
+        return {
+            "length": length,
+            "wetted_area": wetted_area,
+            "max_cross_section_area": max_cross_section_area,
+            "max_diameter": max_diameter,
+            "approx_volume": approx_volume,
+        }
 
     return ToolDefinition(
         name="get_fuselage_summary",
         description="Return key geometric metrics for a fuselage.",
         parameters_model=FuselageSummaryParams,
         handler=handler,
+        error_type="FuselageSummaryError",
+        error_message="Failed to compute fuselage summary",
         output_schema={},
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from tigl_mcp.errors import MCPError, raise_mcp_error
 from tigl_mcp.session_manager import SessionManager
-from tigl_mcp.tooling import ToolDefinition, ToolParameters
+from tigl_mcp.tooling import ToolDefinition, ToolParameters, parse_parameters
 from tigl_mcp.tools.common import require_session
 
 
@@ -49,25 +49,20 @@ def get_high_level_parameters_tool(session_manager: SessionManager) -> ToolDefin
     """Create the get_high_level_parameters tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = GetParametersParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            component = config.find_component(params.component_uid)
-            if component is None:
-                raise_mcp_error(
-                    "NotFound", f"Component '{params.component_uid}' not found"
-                )
-            return {"component_uid": component.uid, "parameters": component.parameters}
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error("ParameterError", "Failed to fetch parameters", str(exc))
+        params = parse_parameters(GetParametersParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        component = config.find_component(params.component_uid)
+        if component is None:
+            raise_mcp_error("NotFound", f"Component '{params.component_uid}' not found")
+        return {"component_uid": component.uid, "parameters": component.parameters}
 
     return ToolDefinition(
         name="get_high_level_parameters",
         description="Return high-level design parameters for a component.",
         parameters_model=GetParametersParams,
         handler=handler,
+        error_type="ParameterError",
+        error_message="Failed to fetch parameters",
         output_schema={},
     )
 
@@ -76,39 +71,39 @@ def set_high_level_parameters_tool(session_manager: SessionManager) -> ToolDefin
     """Create the set_high_level_parameters tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, object]:
-        try:
-            params = SetParametersParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            component = config.find_component(params.component_uid)
-            if component is None:
-                raise_mcp_error(
-                    "NotFound", f"Component '{params.component_uid}' not found"
-                )
-            warnings: list[str] = []
+        params = parse_parameters(SetParametersParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        component = config.find_component(params.component_uid)
+        if component is None:
+            raise_mcp_error("NotFound", f"Component '{params.component_uid}' not found")
+        warnings: list[str] = []
+        if params.updates:
+            # Compute every new value before touching the component, so an
+            # invalid update leaves the parameters exactly as they were.
+            current = component.parameters
+            new_values: dict[str, float] = {}
             for key, value in params.updates.items():
-                current_value = component.parameters.get(key)
                 try:
-                    component.parameters[key] = _apply_update(current_value, value)
+                    new_values[key] = _apply_update(current.get(key), value)
                 except MCPError:
                     raise
                 except Exception as exc:  # pragma: no cover - defensive path
                     warnings.append(f"Skipped '{key}': {exc}")
-            return {
-                "component_uid": component.uid,
-                "new_parameters": component.parameters,
-                "warnings": warnings,
-            }
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "ParameterError", "Failed to apply parameter updates", str(exc)
-            )
+            current.update(new_values)
+            # Exports generated before the update no longer describe the model.
+            session_manager.clear_exports(params.session_id)
+        return {
+            "component_uid": component.uid,
+            "new_parameters": component.parameters,
+            "warnings": warnings,
+        }
 
     return ToolDefinition(
         name="set_high_level_parameters",
         description="Update high-level design parameters and return the new values.",
         parameters_model=SetParametersParams,
         handler=handler,
+        error_type="ParameterError",
+        error_message="Failed to apply parameter updates",
         output_schema={},
     )
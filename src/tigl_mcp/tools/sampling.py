@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from collections.abc import Callable
+from typing import Any, Literal, cast
 
-from tigl_mcp.errors import MCPError, raise_mcp_error
+from tigl_mcp.cpacs import BoundingBox
+from tigl_mcp.errors import raise_mcp_error
 from tigl_mcp.session_manager import SessionManager
-from tigl_mcp.tooling import ToolDefinition, ToolParameters
+from tigl_mcp.tooling import ToolDefinition, ToolParameters, parse_parameters
 from tigl_mcp.tools.common import require_session
 
+SurfaceSample = dict[str, float | int | str | None]
+# "records" returns one dict per point; "columns" returns one list per field,
+# which is far cheaper to build and serialize for large batches.
+PointLayout = Literal["records", "columns"]
+
 
 class SampleSurfaceParams(ToolParameters):
     """Parameters for sample_component_surface."""
@@ -20,7 +27,8 @@ class SampleSurfaceParams(ToolParameters):
         "wing_segment_eta_xsi",
         "fuselage_segment_eta_xsi",
     ]
-    samples: list[dict[str, float | int | str | None]]
+    samples: list[SurfaceSample]
+    layout: PointLayout = "records"
 
 
 class IntersectPlaneParams(ToolParameters):
@@ -31,6 +39,7 @@ class IntersectPlaneParams(ToolParameters):
     plane_point: dict[str, float]
     plane_normal: dict[str, float]
     n_points_per_curve: int = 50
+    layout: PointLayout = "records"
 
 
 class IntersectComponentsParams(ToolParameters):
@@ -40,47 +49,93 @@ class IntersectComponentsParams(ToolParameters):
     component_uid_one: str
     component_uid_two: str
     n_points_per_curve: int = 50
+    layout: PointLayout = "records"
+
+
+def _sample_columns(
+    bbox: BoundingBox, samples: list[SurfaceSample]
+) -> dict[str, list[Any]]:
+    """Map ``(eta, xsi)`` samples onto the bounding box, one list per field."""
+    etas = [float(cast(Any, sample.get("eta", 0.0))) for sample in samples]
+    xsis = [float(cast(Any, sample.get("xsi", 0.0))) for sample in samples]
+    # Read the box once rather than per point inside the comprehensions.
+    xmin, ymin, zmin = bbox.xmin, bbox.ymin, bbox.zmin
+    dx, dy, dz = bbox.xmax - xmin, bbox.ymax - ymin, bbox.zmax - zmin
+    xs = [xmin + dx * eta for eta in etas]
+    ys = [ymin + dy * xsi for xsi in xsis]
+    zs = [zmin + dz * (eta + xsi) / 2.0 for eta, xsi in zip(etas, xsis, strict=True)]
+    sides = [sample.get("side") for sample in samples]
+    return {"eta": etas, "xsi": xsis, "side": sides, "x": xs, "y": ys, "z": zs}
+
+
+def _sample_records(
+    bbox: BoundingBox, samples: list[SurfaceSample]
+) -> list[dict[str, Any]]:
+    """Map ``(eta, xsi)`` samples onto the bounding box, one dict per point."""
+    xmin, ymin, zmin = bbox.xmin, bbox.ymin, bbox.zmin
+    dx, dy, dz = bbox.xmax - xmin, bbox.ymax - ymin, bbox.zmax - zmin
+    points = []
+    for sample in samples:
+        eta = float(cast(Any, sample.get("eta", 0.0)))
+        xsi = float(cast(Any, sample.get("xsi", 0.0)))
+        points.append(
+            {
+                "eta": eta,
+                "xsi": xsi,
+                "side": sample.get("side"),
+                "x": xmin + dx * eta,
+                "y": ymin + dy * xsi,
+                "z": zmin + dz * (eta + xsi) / 2.0,
+            }
+        )
+    return points
+
+
+def _curve(
+    n_points: int,
+    coordinates: Callable[[Any], tuple[Any, Any, Any]],
+    layout: PointLayout,
+) -> dict[str, object]:
+    """Build curve ``0`` by evaluating ``coordinates(t)`` for ``t`` in [0, 1].
+
+    ``coordinates`` receives the whole ``t`` array at once, so the curve is
+    computed with a few array operations instead of a Python loop.
+    """
+    import numpy as np
+
+    # ``index / (n - 1)`` rather than ``np.linspace`` keeps every ``t``
+    # bit-identical to the scalar formula.
+    t = np.arange(n_points, dtype=np.float64) / max(n_points - 1, 1)
+    x_array, y_array, z_array = coordinates(t)
+    xs, ys, zs = x_array.tolist(), y_array.tolist(), z_array.tolist()
+    if layout == "columns":
+        return {"curve_index": 0, "point_columns": {"x": xs, "y": ys, "z": zs}}
+    points = [{"x": x, "y": y, "z": z} for x, y, z in zip(xs, ys, zs, strict=True)]
+    return {"curve_index": 0, "points": points}
 
 
 def sample_component_surface_tool(session_manager: SessionManager) -> ToolDefinition:
     """Create the sample_component_surface tool."""
 
-    def handler(
-        raw_params: dict[str, object],
-    ) -> dict[str, list[dict[str, float | str | None]]]:
-        try:
-            params = SampleSurfaceParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            component = config.find_component(params.component_uid)
-            if component is None:
-                raise_mcp_error(
-                    "NotFound", f"Component '{params.component_uid}' not found"
-                )
-            bbox = component.bounding_box
-            points = []
-            for sample in params.samples:
-                eta_raw: Any = sample.get("eta", 0.0)
-                xsi_raw: Any = sample.get("xsi", 0.0)
-                side = sample.get("side")
-                eta = float(eta_raw)
-                xsi = float(xsi_raw)
-                x = bbox.xmin + (bbox.xmax - bbox.xmin) * eta
-                y = bbox.ymin + (bbox.ymax - bbox.ymin) * xsi
-                z = bbox.zmin + (bbox.zmax - bbox.zmin) * (eta + xsi) / 2.0
-                points.append(
-                    {"eta": eta, "xsi": xsi, "side": side, "x": x, "y": y, "z": z}
-                )
-            return {"points": points}
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error("SampleError", "Failed to sample surface", str(exc))
+    def handler(raw_params: dict[str, object]) -> dict[str, object]:
+        params = parse_parameters(SampleSurfaceParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        component = config.find_component(params.component_uid)
+        if component is None:
+            raise_mcp_error("NotFound", f"Component '{params.component_uid}' not found")
+        if params.layout == "columns":
+            return {
+                "point_columns": _sample_columns(component.bounding_box, params.samples)
+            }
+        return {"points": _sample_records(component.bounding_box, params.samples)}
 
     return ToolDefinition(
         name="sample_component_surface",
         description="Sample 3D points on a component surface.",
         parameters_model=SampleSurfaceParams,
         handler=handler,
+        error_type="SampleError",
+        error_message="Failed to sample surface",
         output_schema={},
     )
 
@@ -89,32 +144,27 @@ def intersect_with_plane_tool(session_manager: SessionManager) -> ToolDefinition
     """Create the intersect_with_plane tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, list[dict[str, object]]]:
-        try:
-            params = IntersectPlaneParams.model_validate(raw_params)
-            _, _, _ = require_session(session_manager, params.session_id)
-            curve_points = []
-            for index in range(params.n_points_per_curve):
-                t = index / max(params.n_points_per_curve - 1, 1)
-                curve_points.append(
-                    {
-                        "x": params.plane_point["x"] + params.plane_normal["nx"] * t,
-                        "y": params.plane_point["y"] + params.plane_normal["ny"] * t,
-                        "z": params.plane_point["z"] + params.plane_normal["nz"] * t,
-                    }
-                )
-            return {"curves": [{"curve_index": 0, "points": curve_points}]}
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "IntersectionError", "Failed to intersect with plane", str(exc)
-            )
+        params = parse_parameters(IntersectPlaneParams, raw_params)
+        _, _, _ = require_session(session_manager, params.session_id)
+        point, normal = params.plane_point, params.plane_normal
+        curve = _curve(
+            params.n_points_per_curve,
+            lambda t: (
+                point["x"] + normal["nx"] * t,
+                point["y"] + normal["ny"] * t,
+                point["z"] + normal["nz"] * t,
+            ),
+            params.layout,
+        )
+        return {"curves": [curve]}
 
     return ToolDefinition(
         name="intersect_with_plane",
         description="Intersect a component with a plane and sample polylines.",
         parameters_model=IntersectPlaneParams,
         handler=handler,
+        error_type="IntersectionError",
+        error_message="Failed to intersect with plane",
         output_schema={},
     )
 
@@ -123,42 +173,34 @@ def intersect_components_tool(session_manager: SessionManager) -> ToolDefinition
     """Create the intersect_components tool."""
 
     def handler(raw_params: dict[str, object]) -> dict[str, list[dict[str, object]]]:
-        try:
-            params = IntersectComponentsParams.model_validate(raw_params)
-            _, _, config = require_session(session_manager, params.session_id)
-            first = config.find_component(params.component_uid_one)
-            second = config.find_component(params.component_uid_two)
-            if first is None or second is None:
-                raise_mcp_error(
-                    "NotFound", "One or both components could not be located"
-                )
-            midpoint = {
-                "x": (first.bounding_box.xmin + second.bounding_box.xmax) / 2.0,
-                "y": (first.bounding_box.ymin + second.bounding_box.ymax) / 2.0,
-                "z": (first.bounding_box.zmin + second.bounding_box.zmax) / 2.0,
-            }
-            curve_points = []
-            for index in range(params.n_points_per_curve):
-                t = index / max(params.n_points_per_curve - 1, 1)
-                curve_points.append(
-                    {
-                        "x": midpoint["x"] * (1 + 0.1 * t),
-                        "y": midpoint["y"] * (1 - 0.1 * t),
-                        "z": midpoint["z"] + t,
-                    }
-                )
-            return {"curves": [{"curve_index": 0, "points": curve_points}]}
-        except MCPError as error:
-            raise error
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise_mcp_error(
-                "IntersectionError", "Failed to intersect components", str(exc)
-            )
+        params = parse_parameters(IntersectComponentsParams, raw_params)
+        _, _, config = require_session(session_manager, params.session_id)
+        first = config.find_component(params.component_uid_one)
+        second = config.find_component(params.component_uid_two)
+        if first is None or second is None:
+            raise_mcp_error("NotFound", "One or both components could not be located")
+        midpoint = {
+            "x": (first.bounding_box.xmin + second.bounding_box.xmax) / 2.0,
+            "y": (first.bounding_box.ymin + second.bounding_box.ymax) / 2.0,
+            "z": (first.bounding_box.zmin + second.bounding_box.zmax) / 2.0,
+        }
+        curve = _curve(
+            params.n_points_per_curve,
+            lambda t: (
+                midpoint["x"] * (1 + 0.1 * t),
+                midpoint["y"] * (1 - 0.1 * t),
+                midpoint["z"] + t,
+            ),
+            params.layout,
+        )
+        return {"curves": [curve]}
 
     return ToolDefinition(
         name="intersect_components",
         description="Intersect two components and return sampled curves.",
         parameters_model=IntersectComponentsParams,
         handler=handler,
+        error_type="IntersectionError",
+        error_message="Failed to intersect components",
         output_schema={},
     )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import importlib.util
+import sys
 from pathlib import Path
 
 import pytest
@@ -29,7 +31,19 @@ SAMPLE_CPACS_XML = """
 """.strip()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def anyio_backend() -> str | tuple[str, dict[str, bool]]:
+    """Run ``anyio``-marked tests on asyncio only, the loop FastMCP serves on.
+
+    When ``uvloop`` is installed (it is optional, and unavailable on
+    Windows) the asyncio backend runs on it instead of the stdlib loop.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return ("asyncio", {"use_uvloop": True})
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
 def sample_cpacs_xml() -> str:
     """Provide a small CPACS-like XML document for testing."""
     return SAMPLE_CPACS_XML
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from tigl_mcp.cpacs import BoundingBox, extract_metadata, parse_cpacs
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from tigl_mcp.cpacs import BoundingBox, build_handles, extract_metadata, parse_cpacs
 
 
 def test_parse_cpacs_extracts_stub_components(sample_cpacs_xml: str) -> None:
@@ -45,6 +50,41 @@ def test_parse_cpacs_accepts_camel_case_uid_attribute() -> None:
     assert config.wings[0].uid == "WingCamelCase"
 
 
+def test_parse_cpacs_indexes_components_per_type_in_document_order() -> None:
+    """Interleaved component tags keep independent, document-ordered indices."""
+    xml = """
+    <cpacs>
+      <wing uID="W1" />
+      <fuselage uID="F1" />
+      <wing uID="W2" />
+      <engine uID="E1" />
+    </cpacs>
+    """.strip()
+    config = parse_cpacs(xml)
+
+    assert [(wing.uid, wing.index) for wing in config.wings] == [("W1", 1), ("W2", 2)]
+    assert [(fuse.uid, fuse.index) for fuse in config.fuselages] == [("F1", 1)]
+    assert config.engines[0].type_name == "Engine"
+    assert config.rotors == []
+    assert [component.uid for component in config.all_components()] == [
+        "W1",
+        "W2",
+        "F1",
+        "E1",
+    ]
+    assert config.all_components() is config.all_components()
+
+
+def test_parse_cpacs_keeps_only_plain_numeric_attributes() -> None:
+    """Only decimal attribute values become numeric component parameters."""
+    config = parse_cpacs(
+        '<cpacs><wing uID="W" span=" 1e3 " sweep="-.5" label="abc" twist="nan" />'
+        "</cpacs>"
+    )
+
+    assert config.wings[0].parameters == {"span": 1000.0, "sweep": -0.5}
+
+
 def test_find_component_supports_case_insensitive_lookup(
     sample_cpacs_xml: str,
 ) -> None:
@@ -56,6 +96,18 @@ def test_find_component_supports_case_insensitive_lookup(
     assert component.uid == "W1"
 
 
+def test_find_component_prefers_exact_uid_match() -> None:
+    """Exact UID matches win over earlier case-insensitive candidates."""
+    config = parse_cpacs('<cpacs><wing uID="wing" /><fuselage uID="WING" /></cpacs>')
+
+    exact = config.find_component("WING")
+    folded = config.find_component("Wing")
+
+    assert exact is not None and exact.type_name == "Fuselage"
+    assert folded is not None and folded.type_name == "Wing"
+    assert config.find_component("missing") is None
+
+
 def test_extract_metadata_reads_header_fields(sample_cpacs_xml: str) -> None:
     """Metadata extraction uses CPACS header content plus the optional file name."""
     metadata = extract_metadata(sample_cpacs_xml, "fixture.cpacs.xml")
@@ -67,6 +119,16 @@ def test_extract_metadata_reads_header_fields(sample_cpacs_xml: str) -> None:
     }
 
 
+def test_build_handles_matches_standalone_parsers(sample_cpacs_xml: str) -> None:
+    """Handles built from one parse agree with the standalone helpers."""
+    tixi, tigl, config, metadata = build_handles(sample_cpacs_xml, "fixture.xml")
+
+    assert tixi.xml_content == sample_cpacs_xml
+    assert tigl.cpacs_configuration is config
+    assert config == parse_cpacs(sample_cpacs_xml)
+    assert metadata == extract_metadata(sample_cpacs_xml, "fixture.xml")
+
+
 def test_bounding_box_generation_is_deterministic() -> None:
     """Stub bounding boxes are deterministic functions of component index."""
     first = BoundingBox.from_index(1)
@@ -78,3 +140,24 @@ def test_bounding_box_generation_is_deterministic() -> None:
     assert second.ymin == -2.0
     assert combined.xmax == 3.0
     assert combined.ymin == -2.0
+    assert BoundingBox.from_index(1) is first
+
+
+def test_bounding_boxes_are_immutable_and_slotted() -> None:
+    """Bounding boxes are compact value objects that cannot be mutated."""
+    box = BoundingBox.from_index(1)
+
+    assert not hasattr(box, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        box.xmin = 5.0  # type: ignore[misc]
+
+
+def test_component_type_names_are_case_folded_and_interned(
+    sample_cpacs_xml: str,
+) -> None:
+    """Type filters compare against a precomputed, interned lowercase name."""
+    wing = parse_cpacs(sample_cpacs_xml).wings[0]
+
+    assert wing.type_name == "Wing"
+    assert wing.type_name_lower is sys.intern("wing")
+    assert wing.uid_bytes == b"W1"
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import AliasChoices, ConfigDict, Field, ValidationError
 
 from tigl_mcp.errors import MCPError
 from tigl_mcp.session_manager import SessionManager
+from tigl_mcp.tooling import (
+    ToolDefinition,
+    ToolParameters,
+    ValidatedParameters,
+    parse_parameters,
+)
 from tigl_mcp.tools import build_tools
 
 
@@ -26,7 +33,9 @@ def test_build_tools_registers_expected_stub_toolset() -> None:
         "intersect_with_plane",
         "intersect_components",
         "export_component_mesh",
+        "export_component_meshes",
         "export_configuration_cad",
+        "get_export_artifact",
         "get_high_level_parameters",
         "set_high_level_parameters",
     ]
@@ -59,3 +68,172 @@ def test_invalid_session_uses_structured_mcp_errors() -> None:
 
     assert error_info.value.error["error"]["type"] == "InvalidSession"
     assert error_info.value.error["error"]["message"] == "Unknown session_id 'missing'"
+
+
+def test_tool_metadata_reuses_cached_parameter_schema() -> None:
+    """Discovery metadata builds each parameter schema only once per tool."""
+    open_tool = build_tools(SessionManager())[1]
+
+    first = open_tool.metadata()
+    second = open_tool.metadata()
+
+    assert first["schema"] == open_tool.parameters_model.model_json_schema()
+    assert first["schema"] is second["schema"]
+
+
+def test_tool_validate_returns_coerced_parameters() -> None:
+    """Validated parameters come back as a plain mapping of coerced values."""
+    intersect_tool = next(
+        tool
+        for tool in build_tools(SessionManager())
+        if tool.name == "intersect_with_plane"
+    )
+
+    validated = intersect_tool.validate(
+        {
+            "session_id": "abc",
+            "component_uid": "W1",
+            "plane_point": {"x": 0, "y": 1, "z": 2},
+            "plane_normal": {"nx": 1, "ny": 0, "nz": 0},
+        }
+    )
+
+    assert validated == {
+        "session_id": "abc",
+        "component_uid": "W1",
+        "plane_point": {"x": 0.0, "y": 1.0, "z": 2.0},
+        "plane_normal": {"nx": 1.0, "ny": 0.0, "nz": 0.0},
+        "n_points_per_curve": 50,
+        "layout": "records",
+    }
+
+
+def test_tool_validate_honours_string_model_config() -> None:
+    """String-only models with custom config options still go through Pydantic."""
+
+    class StrippedParams(ToolParameters):
+        model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+        session_id: str
+
+    tool = ToolDefinition(
+        name="stripped",
+        description="Echo the stripped session id.",
+        parameters_model=StrippedParams,
+        handler=lambda parameters: parameters,
+    )
+
+    assert tool.validate({"session_id": "  abc "}) == {"session_id": "abc"}
+
+
+def test_tool_validate_honours_validation_aliases() -> None:
+    """String-only models with validation aliases still go through Pydantic."""
+
+    class AliasedParams(ToolParameters):
+        session_id: str = Field(validation_alias=AliasChoices("sid", "session"))
+
+    tool = ToolDefinition(
+        name="aliased",
+        description="Echo the aliased session id.",
+        parameters_model=AliasedParams,
+        handler=lambda parameters: parameters,
+    )
+
+    assert tool.validate({"sid": "abc"}) == {"session_id": "abc"}
+    with pytest.raises(ValueError):
+        tool.validate({"session_id": "abc"})
+
+
+def test_tool_validate_reuses_defaults_for_argument_less_calls() -> None:
+    """Empty payloads validate once and then reuse copies of the defaults."""
+    ping = build_tools(SessionManager())[0]
+
+    first = ping.validate({})
+    second = ping.validate({})
+
+    assert first == second == {"message": None}
+    assert first is not second
+
+
+def test_tool_validate_does_not_share_mutable_defaults() -> None:
+    """Argument-less calls never hand out the same mutable default twice."""
+
+    class ListParams(ToolParameters):
+        component_uids: list[str] = []
+
+    tool = ToolDefinition(
+        name="listing",
+        description="Echo the component uids.",
+        parameters_model=ListParams,
+        handler=lambda parameters: parameters,
+    )
+
+    first = tool.validate({})
+    first["component_uids"].append("W1")
+
+    assert tool.validate({}) == {"component_uids": []}
+
+
+def test_parameter_schemas_are_shared_across_tool_builds() -> None:
+    """Rebuilding the toolset reuses each parameter model's cached schema."""
+    first = build_tools(SessionManager())[1].parameters_schema()
+    second = build_tools(SessionManager())[1].parameters_schema()
+
+    assert first is second
+
+
+def test_unexpected_handler_errors_become_tool_specific_mcp_errors() -> None:
+    """Tools map unexpected exceptions to their configured MCP error type."""
+    list_tool = build_tools(SessionManager())[4]
+
+    with pytest.raises(MCPError) as error_info:
+        list_tool.handler({"session_id": "abc", "unexpected": True})
+
+    assert error_info.value.error["error"]["type"] == "ListError"
+    assert error_info.value.error["error"]["message"] == "Failed to list components"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"session_id": "abc"},
+        {"session_id": "abc", "type_filter": "wing"},
+        {"session_id": "abc", "type_filter": None},
+    ],
+)
+def test_string_only_tools_match_pydantic_validation(
+    payload: dict[str, object],
+) -> None:
+    """The plain-string fast path agrees with full Pydantic validation."""
+    list_tool = build_tools(SessionManager())[4]
+    expected = list_tool.parameters_model.model_validate(payload).model_dump()
+
+    assert list_tool.validate(payload) == expected
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"session_id": 1}, {"session_id": None}, {"session_id": "a", "x": 1}],
+)
+def test_string_only_tools_still_reject_invalid_payloads(
+    payload: dict[str, object],
+) -> None:
+    """Payloads the fast path cannot accept still fail Pydantic validation."""
+    list_tool = build_tools(SessionManager())[4]
+
+    with pytest.raises(ValueError):
+        list_tool.validate(payload)
+
+
+def test_handlers_reuse_parameters_validated_by_the_tool_definition() -> None:
+    """Validated payloads are rebuilt into models without a second validation."""
+    list_tool = build_tools(SessionManager())[4]
+    model = list_tool.parameters_model
+
+    validated = list_tool.validate({"session_id": "abc", "type_filter": "wing"})
+    parsed = parse_parameters(model, validated)
+
+    assert isinstance(validated, ValidatedParameters)
+    assert parsed.model_dump() == {"session_id": "abc", "type_filter": "wing"}
+    with pytest.raises(ValidationError):
+        parse_parameters(model, {"session_id": 1})
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import base64
+from pathlib import Path
 
 from tigl_mcp.session_manager import SessionManager
 from tigl_mcp.tooling import ToolDefinition
 from tigl_mcp.tools import build_tools
+from tigl_mcp.tools.export import (
+    _export_configuration_cad_bytes_via_tigl,
+    _written_size,
+)
 
 
 def _tool_by_name(tools: list[ToolDefinition], name: str) -> ToolDefinition:
@@ -34,9 +39,60 @@ def test_export_configuration_cad_includes_cpacs_contents(
 
     result = export_tool.handler({"session_id": session_id, "format": "step"})
 
-    decoded_cad = base64.b64decode(result["cad_base64"]).decode()
-    decoded_cpacs = base64.b64decode(result["cpacs_xml_base64"]).decode()
+    cad_bytes = base64.b64decode(result["cad_base64"])
+    cpacs_bytes = base64.b64decode(result["cpacs_xml_base64"])
 
     assert result["source"] == "stub"
-    assert decoded_cad.startswith("cad:step:")
-    assert decoded_cpacs == sample_cpacs_xml
+    assert cad_bytes.startswith(b"cad:step:")
+    assert cpacs_bytes == sample_cpacs_xml.encode("utf-8")
+
+
+def test_export_configuration_cad_can_skip_cpacs_echo(sample_cpacs_xml: str) -> None:
+    """Clients can opt out of receiving the CPACS XML alongside the CAD."""
+    manager = SessionManager()
+    tools = build_tools(manager)
+    session_id = _tool_by_name(tools, "open_cpacs").handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+    export_tool = _tool_by_name(tools, "export_configuration_cad")
+
+    result = export_tool.handler(
+        {"session_id": session_id, "format": "iges", "include_cpacs_xml": False}
+    )
+
+    assert "cpacs_xml_base64" not in result
+    assert base64.b64decode(result["cad_base64"]).startswith(b"cad:iges:")
+
+
+def test_written_size_reports_zero_for_missing_output(tmp_path: Path) -> None:
+    """Exporter output checks treat a missing file like an empty one."""
+    out_path = tmp_path / "out.step"
+    assert _written_size(out_path) == 0
+
+    out_path.write_bytes(b"ISO-10303-21;")
+    assert _written_size(out_path) == 13
+
+
+def test_cad_exporter_priority_survives_an_earlier_fallback() -> None:
+    """A fallback that worked once does not jump ahead of the fused exporter."""
+    calls: list[str] = []
+
+    class FlakyHandle:
+        fused_fails = True
+
+        def exportFusedSTEP(self, path: str) -> None:  # noqa: N802
+            calls.append("exportFusedSTEP")
+            if FlakyHandle.fused_fails:
+                raise RuntimeError("fusion failed")
+            Path(path).write_bytes(b"fused")
+
+        def exportSTEP(self, path: str) -> None:  # noqa: N802
+            calls.append("exportSTEP")
+            Path(path).write_bytes(b"plain")
+
+    handle = FlakyHandle()
+    assert _export_configuration_cad_bytes_via_tigl(handle, "step") == b"plain"
+
+    FlakyHandle.fused_fails = False
+    assert _export_configuration_cad_bytes_via_tigl(handle, "step") == b"fused"
+    assert calls == ["exportFusedSTEP", "exportSTEP", "exportFusedSTEP"]
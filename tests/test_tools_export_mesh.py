@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import base64
+import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
+from tigl_mcp import su2
 from tigl_mcp.errors import MCPError
 from tigl_mcp.session_manager import SessionManager
+from tigl_mcp.su2 import stl_to_su2_bytes
 from tigl_mcp.tooling import ToolDefinition
-from tigl_mcp.tools import build_tools
-from tigl_mcp.tools.export import _count_stl_triangles, _looks_like_stl_payload
+from tigl_mcp.tools import build_tools, export
+from tigl_mcp.tools.export import (
+    _STL_TEMPLATE,
+    _convert_stl_to_su2_via_meshio,
+    _count_stl_triangles,
+    _export_stl_bytes_via_tigl3,
+    _has_real_tigl_exports,
+    _looks_like_handle,
+    _looks_like_stl_payload,
+)
 
 
 def _tool_by_name(tools: Iterable[ToolDefinition], name: str) -> ToolDefinition:
@@ -119,3 +134,366 @@ def test_export_component_mesh_returns_ascii_stl(sample_cpacs_xml: str) -> None:
     assert mesh_bytes.startswith(b"solid W1")
     assert b"vertex" in mesh_bytes
     assert result["num_triangles"] == 1
+
+
+def test_export_component_mesh_can_return_plain_text(sample_cpacs_xml: str) -> None:
+    """Textual meshes can skip base64 and match the encoded payload exactly."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    mesh_tool = _tool_by_name(build_tools(manager), "export_component_mesh")
+    params = {"session_id": session_id, "component_uid": "W1", "format": "stl"}
+
+    encoded = mesh_tool.handler(params)
+    text = mesh_tool.handler({**params, "encoding": "text"})
+
+    assert "mesh_base64" not in text
+    assert text["mesh_text"].encode("utf-8") == base64.b64decode(encoded["mesh_base64"])
+    assert text["num_triangles"] == encoded["num_triangles"]
+
+
+def test_real_export_detection_is_based_on_the_handle_class() -> None:
+    """Export capability follows the binding class, not the stub."""
+
+    class ExportingHandle:
+        def exportMeshedWingSTL(self) -> None:  # noqa: N802 - mimic TiGL naming
+            return None
+
+    assert _has_real_tigl_exports(ExportingHandle()) is True
+    assert _has_real_tigl_exports(object()) is False
+
+
+def test_looks_like_handle_checks_only_the_payload_prefix() -> None:
+    """Legacy handle strings are detected without decoding the payload."""
+    assert _looks_like_handle(b"mesh:W1:stl") is True
+    assert _looks_like_handle(b"su2-from-stl:W1") is True
+    assert _looks_like_handle(b"solid W1\n\xff") is False
+
+
+def test_export_component_meshes_matches_single_component_exports(
+    sample_cpacs_xml: str,
+) -> None:
+    """Batch export returns one single-export response per component UID."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    tools = build_tools(manager)
+    single_tool = _tool_by_name(tools, "export_component_mesh")
+    batch_tool = _tool_by_name(tools, "export_component_meshes")
+
+    result = batch_tool.handler({"session_id": session_id, "format": "stl"})
+
+    meshes = result["meshes"]
+    assert "W1" in meshes
+    for uid, response in meshes.items():
+        expected = single_tool.handler(
+            {"session_id": session_id, "component_uid": uid, "format": "stl"}
+        )
+        assert response == expected
+
+
+def test_export_component_meshes_rejects_unknown_component(
+    sample_cpacs_xml: str,
+) -> None:
+    """Any unknown UID in the batch raises NotFound."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    batch_tool = _tool_by_name(build_tools(manager), "export_component_meshes")
+
+    with pytest.raises(MCPError) as excinfo:
+        batch_tool.handler(
+            {
+                "session_id": session_id,
+                "format": "stl",
+                "component_uids": ["W1", "DOES_NOT_EXIST"],
+            }
+        )
+
+    assert excinfo.value.error["error"]["type"] == "NotFound"
+
+
+def test_export_component_mesh_reuses_cached_su2_conversion(
+    sample_cpacs_xml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated real SU2 exports in a session skip the conversion entirely."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    mesh_tool = _tool_by_name(build_tools(manager), "export_component_mesh")
+    monkeypatch.setattr(export, "_has_real_tigl_exports", lambda _handle: True)
+    monkeypatch.setattr(
+        export,
+        "_export_mesh_bytes",
+        lambda _handle, component, _format: _STL_TEMPLATE % {b"uid": b"W1"},
+    )
+    params = {"session_id": session_id, "component_uid": "W1", "format": "su2"}
+    first = mesh_tool.handler(params)
+
+    def fail_conversion(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("SU2 conversion should be cached")
+
+    monkeypatch.setattr(su2, "stl_to_su2_bytes", fail_conversion)
+    monkeypatch.setattr(export, "_convert_stl_to_su2_via_meshio", fail_conversion)
+
+    assert mesh_tool.handler(params) == first
+
+
+def test_export_component_mesh_artifact_can_be_fetched_in_chunks(
+    sample_cpacs_xml: str,
+) -> None:
+    """Artifact exports return an id whose chunks reassemble the payload."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    tools = build_tools(manager)
+    mesh_tool = _tool_by_name(tools, "export_component_mesh")
+    artifact_tool = _tool_by_name(tools, "get_export_artifact")
+    params = {"session_id": session_id, "component_uid": "W1", "format": "stl"}
+
+    encoded = mesh_tool.handler(params)
+    stored = mesh_tool.handler({**params, "encoding": "artifact"})
+    artifact_id = stored["mesh_artifact_id"]
+    expected = base64.b64decode(encoded["mesh_base64"])
+
+    chunks = []
+    offset = 0
+    while offset < len(expected):
+        chunk = artifact_tool.handler(
+            {
+                "session_id": session_id,
+                "artifact_id": artifact_id,
+                "offset": offset,
+                "length": 16,
+            }
+        )
+        assert chunk["size"] == len(expected)
+        chunks.append(base64.b64decode(chunk["data_base64"]))
+        offset += 16
+
+    assert "mesh_base64" not in stored
+    assert stored["num_triangles"] == encoded["num_triangles"]
+    assert b"".join(chunks) == expected
+
+    manager.close(session_id)
+    with pytest.raises(MCPError) as excinfo:
+        artifact_tool.handler({"session_id": session_id, "artifact_id": artifact_id})
+    assert excinfo.value.error["error"]["type"] == "InvalidSession"
+
+
+def test_session_artifacts_evict_least_recently_read(
+    sample_cpacs_xml: str,
+) -> None:
+    """Artifacts beyond the per-session byte budget are dropped oldest first."""
+    manager = SessionManager(max_artifact_bytes=10)
+    session_id = _open_session(manager, sample_cpacs_xml)
+
+    first = manager.store_artifact(session_id, b"a" * 4)
+    second = manager.store_artifact(session_id, b"b" * 4)
+    manager.get_artifact(session_id, first)
+    third = manager.store_artifact(session_id, b"c" * 4)
+
+    assert manager.get_artifact(session_id, first) == b"aaaa"
+    assert manager.get_artifact(session_id, third) == b"cccc"
+    with pytest.raises(MCPError) as excinfo:
+        manager.get_artifact(session_id, second)
+    assert excinfo.value.error["error"]["type"] == "NotFound"
+
+    oversized = manager.store_artifact(session_id, b"d" * 32)
+    assert manager.get_artifact(session_id, oversized) == b"d" * 32
+
+
+def test_get_export_artifact_checks_range_before_lookup(
+    sample_cpacs_xml: str,
+) -> None:
+    """A bad offset is reported even when the artifact id is unknown."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    artifact_tool = _tool_by_name(build_tools(manager), "get_export_artifact")
+
+    with pytest.raises(MCPError) as excinfo:
+        artifact_tool.handler(
+            {"session_id": session_id, "artifact_id": "missing", "offset": -1}
+        )
+    assert excinfo.value.error["error"]["type"] == "InvalidInput"
+
+
+# meshio probes ASCII STL as binary first, overflowing a uint32 on the header.
+@pytest.mark.filterwarnings("ignore:overflow encountered:RuntimeWarning")
+def test_direct_su2_conversion_matches_meshio() -> None:
+    """The direct STL->SU2 converter reproduces meshio's output exactly."""
+    rng = np.random.default_rng(0)
+    points = rng.random((12, 3)).astype("<f4")
+    triangles = rng.integers(0, len(points), (30, 3))
+    records = np.zeros(
+        len(triangles),
+        dtype=[("normal", "<f4", (3,)), ("facet", "<f4", (3, 3)), ("attr", "<u2")],
+    )
+    records["facet"] = points[triangles]
+    binary_stl = b"\x00" * 80 + len(triangles).to_bytes(4, "little") + records.tobytes()
+    component = SimpleNamespace(uid="W1")
+
+    for stl_bytes in (binary_stl, _STL_TEMPLATE % {b"uid": b"W1"}):
+        expected = _convert_stl_to_su2_via_meshio(stl_bytes, component)  # type: ignore[arg-type]
+        assert stl_to_su2_bytes(stl_bytes) == expected
+
+    assert stl_to_su2_bytes(b"solid empty\nendsolid empty\n") is None
+
+
+def test_real_mesh_exports_are_cached_until_parameters_change(
+    sample_cpacs_xml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Real TiGL meshes are reused per session and dropped after an edit."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    tools = build_tools(manager)
+    mesh_tool = _tool_by_name(tools, "export_component_mesh")
+    set_tool = _tool_by_name(tools, "set_high_level_parameters")
+    calls: list[str] = []
+
+    def fake_export(_handle: object, component: object, mesh_format: str) -> bytes:
+        calls.append(mesh_format)
+        return b"solid W1\nendsolid W1\n"
+
+    monkeypatch.setattr(export, "_has_real_tigl_exports", lambda _handle: True)
+    monkeypatch.setattr(export, "_export_mesh_bytes", fake_export)
+    params = {"session_id": session_id, "component_uid": "W1", "format": "stl"}
+
+    first = mesh_tool.handler(params)
+    assert mesh_tool.handler(params) == first
+    assert calls == ["stl"]
+
+    set_tool.handler(
+        {"session_id": session_id, "component_uid": "W1", "updates": {"span": "+1"}}
+    )
+    mesh_tool.handler(params)
+    assert calls == ["stl", "stl"]
+
+
+def test_real_su2_export_reuses_the_cached_stl_export(
+    sample_cpacs_xml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """SU2 after STL converts the session's STL instead of meshing again."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    mesh_tool = _tool_by_name(build_tools(manager), "export_component_mesh")
+    calls: list[str] = []
+
+    def fake_export(_handle: object, component: object, mesh_format: str) -> bytes:
+        calls.append(mesh_format)
+        return (
+            b"solid W1\nfacet normal 0 0 1\nouter loop\n"
+            b"vertex 0 0 0\nvertex 1 0 0\nvertex 0 1 0\n"
+            b"endloop\nendfacet\nendsolid W1\n"
+        )
+
+    monkeypatch.setattr(export, "_has_real_tigl_exports", lambda _handle: True)
+    monkeypatch.setattr(export, "_export_mesh_bytes", fake_export)
+    params = {"session_id": session_id, "component_uid": "W1", "encoding": "text"}
+
+    mesh_tool.handler({**params, "format": "stl"})
+    result = mesh_tool.handler({**params, "format": "su2"})
+
+    assert calls == ["stl"]
+    assert str(result["mesh_text"]).startswith("NDIME= 3\nNPOIN= 3\n")
+
+
+def test_concurrent_real_exports_share_one_tigl_call(
+    sample_cpacs_xml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Parallel exports of a session never mesh twice or overlap TiGL calls."""
+    manager = SessionManager()
+    session_id = _open_session(manager, sample_cpacs_xml)
+    tools = build_tools(manager)
+    mesh_tool = _tool_by_name(tools, "export_component_mesh")
+    batch_tool = _tool_by_name(tools, "export_component_meshes")
+    calls: list[tuple[str, str]] = []
+    active = 0
+    overlapped = False
+
+    def fake_export(_handle: object, component: object, mesh_format: str) -> bytes:
+        nonlocal active, overlapped
+        active += 1
+        overlapped = overlapped or active > 1
+        time.sleep(0.01)
+        calls.append((component.uid, mesh_format))  # type: ignore[attr-defined]
+        active -= 1
+        return (
+            b"solid W1\nfacet normal 0 0 1\nouter loop\n"
+            b"vertex 0 0 0\nvertex 1 0 0\nvertex 0 1 0\n"
+            b"endloop\nendfacet\nendsolid W1\n"
+        )
+
+    monkeypatch.setattr(export, "_has_real_tigl_exports", lambda _handle: True)
+    monkeypatch.setattr(export, "_export_mesh_bytes", fake_export)
+    params = {"session_id": session_id, "component_uid": "W1"}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                mesh_tool.handler,
+                [{**params, "format": mesh_format} for mesh_format in ("su2", "stl")]
+                * 4,
+            )
+        )
+    batch = batch_tool.handler({"session_id": session_id, "format": "su2"})
+
+    assert not overlapped
+    assert calls.count(("W1", "stl")) == 1
+    assert len(calls) == len(set(calls)) == len(batch["meshes"])
+
+
+def test_stl_export_keeps_trying_the_deflection_signature_first() -> None:
+    """Only rejected signatures are skipped; deflection stays the first choice."""
+    calls: list[int] = []
+    stl = b"solid W1\nendsolid W1\n"
+
+    class FlakyWingHandle:
+        deflection_fails = True
+
+        def exportMeshedWingSTLByUID(self, *args: object) -> None:  # noqa: N802
+            calls.append(len(args))
+            if len(args) == 3 and FlakyWingHandle.deflection_fails:
+                raise RuntimeError("meshing failed")
+            Path(str(args[1])).write_bytes(stl)
+
+    class TwoArgWingHandle:
+        def exportMeshedWingSTLByUID(self, uid: str, path: str) -> None:  # noqa: N802
+            calls.append(2)
+            Path(path).write_bytes(stl)
+
+    component = SimpleNamespace(
+        uid="W1", index=1, type_name="Wing", type_name_lower="wing"
+    )
+
+    assert _export_stl_bytes_via_tigl3(FlakyWingHandle(), component) == stl  # type: ignore[arg-type]
+    FlakyWingHandle.deflection_fails = False
+    assert _export_stl_bytes_via_tigl3(FlakyWingHandle(), component) == stl  # type: ignore[arg-type]
+    assert calls == [3, 2, 3]
+
+    calls.clear()
+    assert _export_stl_bytes_via_tigl3(TwoArgWingHandle(), component) == stl  # type: ignore[arg-type]
+    assert _export_stl_bytes_via_tigl3(TwoArgWingHandle(), component) == stl  # type: ignore[arg-type]
+    assert calls == [2, 2]
+
+
+def test_real_mesh_export_cache_is_bounded_by_bytes(
+    sample_cpacs_xml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached exports beyond the session byte budget are evicted oldest first."""
+    stl = b"solid W1\nendsolid W1\n"
+    manager = SessionManager(max_export_bytes=len(stl))
+    session_id = _open_session(manager, sample_cpacs_xml)
+    mesh_tool = _tool_by_name(build_tools(manager), "export_component_mesh")
+    calls: list[str] = []
+
+    def fake_export(_handle: object, component: object, mesh_format: str) -> bytes:
+        calls.append(mesh_format)
+        return stl
+
+    monkeypatch.setattr(export, "_has_real_tigl_exports", lambda _handle: True)
+    monkeypatch.setattr(export, "_export_mesh_bytes", fake_export)
+    params = {"session_id": session_id, "component_uid": "W1"}
+
+    mesh_tool.handler({**params, "format": "stl"})
+    mesh_tool.handler({**params, "format": "vtk"})
+    mesh_tool.handler({**params, "format": "vtk"})
+    mesh_tool.handler({**params, "format": "stl"})
+
+    assert calls == ["stl", "vtk", "stl"]
+    assert len(manager.export_cache(session_id)) == 1
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import gc
+import weakref
 
 import pytest
 from fastmcp.client import Client
@@ -67,48 +70,74 @@ async def test_fastmcp_server_exposes_stubbed_export_endpoints(
         )
         session_id = open_result.data["session_id"]
 
-        components = await client.call_tool(
-            "list_geometric_components", {"session_id": session_id}
+        # The calls below only read the session, so they are issued together.
+        (
+            components,
+            wing_metadata,
+            wing_summary,
+            fuselage_summary,
+            mesh_export,
+            cad_export,
+        ) = await asyncio.gather(
+            client.call_tool("list_geometric_components", {"session_id": session_id}),
+            client.call_tool(
+                "get_component_metadata",
+                {"session_id": session_id, "component_uid": "W1"},
+            ),
+            client.call_tool(
+                "get_wing_summary", {"session_id": session_id, "wing_uid": "W1"}
+            ),
+            client.call_tool(
+                "get_fuselage_summary",
+                {"session_id": session_id, "fuselage_uid": "F1"},
+            ),
+            client.call_tool(
+                "export_component_mesh",
+                {"session_id": session_id, "component_uid": "W1", "format": "stl"},
+            ),
+            client.call_tool(
+                "export_configuration_cad",
+                {"session_id": session_id, "format": "iges"},
+            ),
         )
+
         assert {component["uid"] for component in components.data["components"]} == {
             "W1",
             "F1",
         }
-
-        wing_metadata = await client.call_tool(
-            "get_component_metadata",
-            {"session_id": session_id, "component_uid": "W1"},
-        )
         assert wing_metadata.data["wing_data"]["num_segments"] == 0
-
-        wing_summary = await client.call_tool(
-            "get_wing_summary", {"session_id": session_id, "wing_uid": "W1"}
-        )
         assert wing_summary.data["span"] > 0.0
-
-        fuselage_summary = await client.call_tool(
-            "get_fuselage_summary",
-            {"session_id": session_id, "fuselage_uid": "F1"},
-        )
         assert fuselage_summary.data["length"] > 0.0
 
-        mesh_export = await client.call_tool(
-            "export_component_mesh",
-            {
-                "session_id": session_id,
-                "component_uid": "W1",
-                "format": "stl",
-            },
-        )
         mesh_bytes = base64.b64decode(mesh_export.data["mesh_base64"])
         assert mesh_bytes.startswith(b"solid W1")
-
-        cad_export = await client.call_tool(
-            "export_configuration_cad", {"session_id": session_id, "format": "iges"}
-        )
-        cad_text = base64.b64decode(cad_export.data["cad_base64"]).decode()
-        cpacs_text = base64.b64decode(cad_export.data["cpacs_xml_base64"]).decode()
-        assert cad_text.startswith("cad:iges:")
+        cad_bytes = base64.b64decode(cad_export.data["cad_base64"])
+        cpacs_bytes = base64.b64decode(cad_export.data["cpacs_xml_base64"])
+        assert cad_bytes.startswith(b"cad:iges:")
         assert cad_export.data["source"] == "stub"
-        assert "<cpacs>" in cad_text
-        assert "<cpacs>" in cpacs_text
+        assert b"<cpacs>" in cad_bytes
+        assert b"<cpacs>" in cpacs_bytes
+
+
+def test_build_fastmcp_app_reuses_live_app_per_session_manager() -> None:
+    """Rebuilding for the same manager returns the already-registered app."""
+    manager = SessionManager()
+    app, tools = build_fastmcp_app(manager)
+    again, tools_again = build_fastmcp_app(manager)
+    other, _ = build_fastmcp_app(SessionManager())
+
+    assert again is app
+    assert [tool.name for tool in tools_again] == [tool.name for tool in tools]
+    assert other is not app
+
+
+def test_build_fastmcp_app_does_not_keep_session_managers_alive() -> None:
+    """The app memo holds managers weakly once the caller drops the app."""
+    manager = SessionManager()
+    manager_ref = weakref.ref(manager)
+    build_fastmcp_app(manager)
+
+    del manager
+    gc.collect()
+
+    assert manager_ref() is None
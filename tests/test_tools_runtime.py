@@ -6,10 +6,12 @@ from pathlib import Path
 
 import pytest
 
+from tigl_mcp.cpacs import TiglConfiguration, build_handles
 from tigl_mcp.errors import MCPError
 from tigl_mcp.session_manager import SessionManager
 from tigl_mcp.tooling import ToolDefinition
 from tigl_mcp.tools import build_tools
+from tigl_mcp.tools.common import format_bounding_box
 from tigl_mcp.tools.parameters import set_high_level_parameters_tool
 
 
@@ -47,6 +49,61 @@ def test_open_and_summarize_configuration(sample_cpacs_xml: str) -> None:
         summary_tool.handler({"session_id": session_id})
 
 
+def test_list_components_filters_by_type(sample_cpacs_xml: str) -> None:
+    """Type filters are case-insensitive and entries omit geometry details."""
+    manager = SessionManager()
+    tools = build_tools(manager)
+    session_id = _tool_by_name(tools, "open_cpacs").handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+    list_tool = _tool_by_name(tools, "list_geometric_components")
+
+    result = list_tool.handler({"session_id": session_id, "type_filter": "WING"})
+
+    assert [entry["uid"] for entry in result["components"]] == ["W1"]
+    assert set(result["components"][0]) == {
+        "uid",
+        "name",
+        "index",
+        "type",
+        "parent_uid",
+        "label",
+    }
+
+
+def test_close_releases_document_when_configuration_close_fails(
+    sample_cpacs_xml: str,
+) -> None:
+    """A failing TiGL close still closes TiXI and unregisters the session."""
+
+    class FailingTigl(TiglConfiguration):
+        def close(self) -> None:
+            raise RuntimeError("close failed")
+
+    tixi, _, config, _ = build_handles(sample_cpacs_xml, None)
+    manager = SessionManager()
+    session_id = manager.create_session(
+        tixi, FailingTigl(cpacs_configuration=config), config, sample_cpacs_xml
+    )
+
+    with pytest.raises(RuntimeError):
+        manager.close(session_id)
+
+    assert tixi.closed is True
+    with pytest.raises(MCPError):
+        manager.get(session_id)
+
+
+def test_format_bounding_box_coerces_mappings() -> None:
+    """Dictionary bounding boxes are normalized to float values."""
+    raw = {"xmin": 0, "xmax": 1, "ymin": 0, "ymax": 2, "zmin": 0, "zmax": 3}
+
+    formatted = format_bounding_box(raw)  # type: ignore[arg-type]
+
+    assert formatted == {key: float(value) for key, value in raw.items()}
+    assert all(isinstance(value, float) for value in formatted.values())
+
+
 def test_open_cpacs_supports_path_inputs(sample_cpacs_path: Path) -> None:
     """Path-based opens return the file name in extracted metadata."""
     manager = SessionManager()
@@ -60,6 +117,32 @@ def test_open_cpacs_supports_path_inputs(sample_cpacs_path: Path) -> None:
     assert result["configuration_summary"]["num_wings"] == 1
 
 
+def test_open_cpacs_reads_large_files(tmp_path: Path, sample_cpacs_xml: str) -> None:
+    """Files above the memory-map threshold load exactly like small ones."""
+    padding = "<!--" + "x" * (2 << 20) + "-->"
+    large_path = tmp_path / "large.xml"
+    large_path.write_text(sample_cpacs_xml + padding, encoding="utf-8")
+    manager = SessionManager()
+    open_tool = _tool_by_name(build_tools(manager), "open_cpacs")
+
+    result = open_tool.handler({"source_type": "path", "source": str(large_path)})
+
+    assert result["configuration_summary"]["num_wings"] == 1
+    assert manager.get_cpacs_xml(result["session_id"]).endswith(padding)
+
+
+def test_open_cpacs_reports_missing_paths(tmp_path: Path) -> None:
+    """Opening a nonexistent file surfaces an InvalidInput error."""
+    open_tool = _tool_by_name(build_tools(SessionManager()), "open_cpacs")
+
+    with pytest.raises(MCPError) as error_info:
+        open_tool.handler(
+            {"source_type": "path", "source": str(tmp_path / "missing.xml")}
+        )
+
+    assert error_info.value.error["error"]["type"] == "InvalidInput"
+
+
 def test_parameter_updates_support_relative_changes(sample_cpacs_xml: str) -> None:
     """Parameter mutation uses current deterministic stub values as the baseline."""
     manager = SessionManager()
@@ -81,6 +164,32 @@ def test_parameter_updates_support_relative_changes(sample_cpacs_xml: str) -> No
     assert update_result["new_parameters"]["area"] == 85.0
 
 
+def test_failed_parameter_update_leaves_parameters_unchanged(
+    sample_cpacs_xml: str,
+) -> None:
+    """An invalid entry rejects the whole batch instead of applying part of it."""
+    manager = SessionManager()
+    open_tool = _tool_by_name(build_tools(manager), "open_cpacs")
+    session_id = open_tool.handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+    component = manager.get(session_id)[2].find_component("W1")
+    before = dict(component.parameters)
+
+    setter = set_high_level_parameters_tool(manager)
+    with pytest.raises(MCPError) as error_info:
+        setter.handler(
+            {
+                "session_id": session_id,
+                "component_uid": "W1",
+                "updates": {"span": "+1", "unknown": "+5%"},
+            }
+        )
+
+    assert error_info.value.error["error"]["type"] == "UpdateError"
+    assert component.parameters == before
+
+
 def test_sampling_and_intersections_return_deterministic_stub_shapes(
     sample_cpacs_xml: str,
 ) -> None:
@@ -129,6 +238,104 @@ def test_sampling_and_intersections_return_deterministic_stub_shapes(
     assert len(component_result["curves"][0]["points"]) == 4
 
 
+def test_large_sample_batches_match_the_scalar_formula(sample_cpacs_xml: str) -> None:
+    """Large sample batches return exactly what the per-point formula gives."""
+    manager = SessionManager()
+    tools = build_tools(manager)
+    open_tool = _tool_by_name(tools, "open_cpacs")
+    sample_tool = _tool_by_name(tools, "sample_component_surface")
+    session_id = open_tool.handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+    bbox = manager.get(session_id)[2].find_component("W1").bounding_box
+    samples = [{"eta": i / 7, "xsi": "0.3", "side": "upper"} for i in range(20)]
+
+    points = sample_tool.handler(
+        {
+            "session_id": session_id,
+            "component_uid": "W1",
+            "parameterization": "wing_component_segment_eta_xsi",
+            "samples": samples,
+        }
+    )["points"]
+
+    assert [point["x"] for point in points] == [
+        bbox.xmin + (bbox.xmax - bbox.xmin) * (i / 7) for i in range(20)
+    ]
+    assert [point["z"] for point in points] == [
+        bbox.zmin + (bbox.zmax - bbox.zmin) * (i / 7 + 0.3) / 2.0 for i in range(20)
+    ]
+    assert all(type(point["y"]) is float for point in points)
+    assert {point["side"] for point in points} == {"upper"}
+
+
+def test_plane_intersection_curve_matches_the_scalar_formula(
+    sample_cpacs_xml: str,
+) -> None:
+    """Vectorized curve sampling returns exactly the per-point values."""
+    manager = SessionManager()
+    tools = build_tools(manager)
+    open_tool = _tool_by_name(tools, "open_cpacs")
+    plane_tool = _tool_by_name(tools, "intersect_with_plane")
+    session_id = open_tool.handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+
+    for n_points in (0, 1, 7, 50):
+        points = plane_tool.handler(
+            {
+                "session_id": session_id,
+                "component_uid": "W1",
+                "plane_point": {"x": 0.1, "y": 0.2, "z": 0.3},
+                "plane_normal": {"nx": 0.7, "ny": 0.0, "nz": 1.3},
+                "n_points_per_curve": n_points,
+            }
+        )["curves"][0]["points"]
+        ts = [index / max(n_points - 1, 1) for index in range(n_points)]
+
+        assert points == [
+            {"x": 0.1 + 0.7 * t, "y": 0.2 + 0.0 * t, "z": 0.3 + 1.3 * t} for t in ts
+        ]
+
+
+def test_columnar_layout_carries_the_same_points(sample_cpacs_xml: str) -> None:
+    """The columns layout holds the record layout's values, one list per field."""
+    manager = SessionManager()
+    tools = build_tools(manager)
+    open_tool = _tool_by_name(tools, "open_cpacs")
+    sample_tool = _tool_by_name(tools, "sample_component_surface")
+    components_tool = _tool_by_name(tools, "intersect_components")
+    session_id = open_tool.handler(
+        {"source_type": "xml_string", "source": sample_cpacs_xml}
+    )["session_id"]
+    sample_params = {
+        "session_id": session_id,
+        "component_uid": "W1",
+        "parameterization": "wing_component_segment_eta_xsi",
+        "samples": [{"eta": 0.1 * i, "xsi": 0.5, "side": "lower"} for i in range(3)],
+    }
+    curve_params = {
+        "session_id": session_id,
+        "component_uid_one": "W1",
+        "component_uid_two": "F1",
+        "n_points_per_curve": 5,
+    }
+
+    records = sample_tool.handler(sample_params)["points"]
+    columns = sample_tool.handler({**sample_params, "layout": "columns"})[
+        "point_columns"
+    ]
+    curve_records = components_tool.handler(curve_params)["curves"][0]["points"]
+    curve_columns = components_tool.handler({**curve_params, "layout": "columns"})[
+        "curves"
+    ][0]["point_columns"]
+
+    assert columns == {key: [point[key] for point in records] for key in records[0]}
+    assert curve_columns == {
+        key: [point[key] for point in curve_records] for key in ("x", "y", "z")
+    }
+
+
 def test_component_lookup_is_case_insensitive(sample_cpacs_xml: str) -> None:
     """Tool handlers resolve component IDs case-insensitively."""
     manager = SessionManager()